@@ -6,37 +6,271 @@ Adapted from CodeWiki reference implementation.
 """
 
 import json
+import re
 from collections import defaultdict
+from collections.abc import Iterator
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; without it the graph is loaded whole
+    ijson = None
+
+
+class ComponentTable:
+    """Structure-of-arrays view of the dependency graph.
+
+    Components are addressed by integer index and their attributes live in
+    parallel lists; dependency edges are stored as index lists. The graph's
+    own id lists are dropped once resolved, except for the few components
+    that list ids missing from the graph (``unresolved_depends_on``). Modules
+    are likewise addressed by index, with -1 meaning "no module".
+    """
+
+    __slots__ = (
+        "ids",
+        "id_to_idx",
+        "declared_ids",
+        "names",
+        "names_lower",
+        "types",
+        "file_paths",
+        "relative_paths",
+        "raw_depends_on",
+        "unresolved_depends_on",
+        "depends_on",
+        "depended_by",
+        "module_of",
+        "modules",
+        "module_to_idx",
+        "module_internal_edges",
+        "module_external_edges",
+    )
+
+    def __init__(self, modules: list[str]):
+        """Initialize an empty table over the given module paths."""
+        self.ids: list[str] = []
+        self.id_to_idx: dict[str, int] = {}
+        self.declared_ids: list[str] = []
+        self.names: list[str] = []
+        self.names_lower: list[str] = []
+        self.types: list[str] = []
+        self.file_paths: list[str] = []
+        self.relative_paths: list[str] = []
+        self.raw_depends_on: list[list[str]] = []
+        self.unresolved_depends_on: dict[int, list[str]] = {}
+        self.depends_on: list[list[int]] = []
+        self.depended_by: list[list[int]] = []
+        self.module_of: list[int] = []
+        self.modules = modules
+        self.module_to_idx = {path: idx for idx, path in enumerate(modules)}
+        self.module_internal_edges: list[int] = [0] * len(modules)
+        self.module_external_edges: list[int] = [0] * len(modules)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, comp_id: str, comp_data: dict[str, Any], module: str | None) -> None:
+        """Append a component from its dependency-graph entry."""
+        name = comp_data.get("name") or comp_id.rpartition(".")[2]
+
+        self.id_to_idx[comp_id] = len(self.ids)
+        self.ids.append(comp_id)
+        self.declared_ids.append(comp_data.get("id", comp_id))
+        self.names.append(name)
+        self.names_lower.append(name.lower())
+        self.types.append(comp_data.get("component_type", "unknown"))
+        self.file_paths.append(comp_data.get("file_path", ""))
+        self.relative_paths.append(comp_data.get("relative_path", ""))
+        self.raw_depends_on.append(comp_data.get("depends_on", []))
+        self.module_of.append(self.module_to_idx.get(module, -1))
+
+    def link(self) -> None:
+        """Resolve dependency ids to indices and fill in reverse edges."""
+        id_to_idx = self.id_to_idx
+        self.depends_on = [
+            [id_to_idx[dep_id] for dep_id in deps if dep_id in id_to_idx]
+            for deps in self.raw_depends_on
+        ]
+        # Only lists naming ids outside the graph differ from their resolved form
+        self.unresolved_depends_on = {
+            idx: deps
+            for idx, (deps, resolved) in enumerate(zip(self.raw_depends_on, self.depends_on))
+            if len(deps) != len(resolved)
+        }
+        self.raw_depends_on = []
+
+        depended_by: list[list[int]] = [[] for _ in range(len(self.ids))]
+        for idx, deps in enumerate(self.depends_on):
+            for dep_idx in deps:
+                depended_by[dep_idx].append(idx)
+        self.depended_by = depended_by
+
+    def count_module_edges(self, member_modules: list[int], member_components: list[int]) -> None:
+        """Tally internal/external dependency edges per module.
+
+        ``member_modules[k]`` lists ``member_components[k]`` as one of its
+        components; an edge is internal when its target belongs to that module.
+        """
+        n_modules = len(self.modules)
+        internal_counts = [0] * n_modules
+        external_counts = [0] * n_modules
+        module_of = self.module_of
+        for module_idx, src in zip(member_modules, member_components):
+            for dep_idx in self.depends_on[src]:
+                dep_module = module_of[dep_idx]
+                if dep_module == module_idx:
+                    internal_counts[module_idx] += 1
+                elif dep_module >= 0:
+                    external_counts[module_idx] += 1
+        self.module_internal_edges = internal_counts
+        self.module_external_edges = external_counts
+
+    def module_path(self, module_idx: int) -> str | None:
+        """Return the module path for an index, or None for -1."""
+        return self.modules[module_idx] if module_idx >= 0 else None
+
+    def dependency_ids(self, idx: int) -> list[str]:
+        """Return a component's dependency ids as listed in the graph."""
+        depends_on = self.unresolved_depends_on.get(idx)
+        if depends_on is None:
+            ids = self.ids
+            depends_on = [ids[dep_idx] for dep_idx in self.depends_on[idx]]
+        return depends_on
+
+    def record(self, idx: int) -> dict[str, Any]:
+        """Materialize the component-map record for one component."""
+        ids = self.ids
+        dependents = [ids[dep_idx] for dep_idx in self.depended_by[idx]]
+        depends_on = self.dependency_ids(idx)
+
+        return {
+            "id": self.declared_ids[idx],
+            "name": self.names[idx],
+            "name_lower": self.names_lower[idx],
+            "component_type": self.types[idx],
+            "file_path": self.file_paths[idx],
+            "relative_path": self.relative_paths[idx],
+            "depends_on": depends_on,
+            "module": self.module_path(self.module_of[idx]),
+            "dependency_count": len(depends_on),
+            "depended_by": dependents,
+            "dependent_count": len(dependents),
+        }
+
+    def reverse_map(self) -> dict[str, list[str]]:
+        """Map every depended-on id (including unknown ones) to its dependents."""
+        ids = self.ids
+        reverse: dict[str, list[str]] = {}
+        for idx in range(len(ids)):
+            for dep_id in self.dependency_ids(idx):
+                if dep_id in reverse:
+                    reverse[dep_id].append(ids[idx])
+                else:
+                    reverse[dep_id] = [ids[idx]]
+        return reverse
+
 
 class GatomiaAnalyzer:
     """Main analyzer class for GatomIA documentation generation."""
 
+    # Name fragments used to infer a component's role, in priority order.
+    ROLE_PATTERNS: dict[str, tuple[str, float, str]] = {
+        "manager": ("manager", 0.8, "manages resources or lifecycle"),
+        "service": ("service", 0.8, "provides business logic"),
+        "generator": ("generator", 0.8, "object creation or construction"),
+        "builder": ("generator", 0.8, "object creation or construction"),
+        "analyzer": ("analyzer", 0.8, "data analysis or transformation"),
+        "parser": ("analyzer", 0.8, "data analysis or transformation"),
+        "handler": ("processor", 0.7, "event handling or data processing"),
+        "processor": ("processor", 0.7, "event handling or data processing"),
+        "adapter": ("adapter", 0.8, "interface adaptation or wrapping"),
+        "wrapper": ("adapter", 0.8, "interface adaptation or wrapping"),
+        "model": ("model", 0.7, "data structure or entity"),
+        "entity": ("model", 0.7, "data structure or entity"),
+        "dto": ("model", 0.7, "data structure or entity"),
+        "util": ("utility", 0.7, "helper functions"),
+        "helper": ("utility", 0.7, "helper functions"),
+        "config": ("configuration", 0.8, "configuration management"),
+        "settings": ("configuration", 0.8, "configuration management"),
+    }
+
+    ROLE_DESCRIPTIONS: dict[str, str] = {
+        "manager": "{name} manages lifecycle and resources",
+        "service": "{name} provides business logic and operations",
+        "generator": "{name} creates or constructs objects/data",
+        "analyzer": "{name} analyzes or transforms data",
+        "processor": "{name} processes data or handles events",
+        "adapter": "{name} adapts or wraps external interfaces",
+        "model": "{name} represents data structure or entity",
+        "utility": "{name} provides helper functions",
+        "configuration": "{name} manages configuration settings",
+        "controller": "{name} orchestrates operations",
+        "unknown": "{name} ({comp_type})",
+    }
+
+    # Zero-width lookahead so every (possibly overlapping) fragment is found in
+    # a single scan; the highest-priority hit then wins, as in ROLE_PATTERNS.
+    _ROLE_RE = re.compile("(?=(" + "|".join(map(re.escape, ROLE_PATTERNS)) + "))")
+    _ROLE_PRIORITY = {pattern: idx for idx, pattern in enumerate(ROLE_PATTERNS)}
+
     def __init__(self, module_tree_path: str, dependency_graph_path: str):
         """Initialize analyzer with input files."""
         self.module_tree = self._load_json(module_tree_path)
-        self.dependency_graph = self._load_json(dependency_graph_path)
+        self.dependency_graph_path = dependency_graph_path
 
-        # Parsed structures
+        # Parsed structures; component data is built lazily (see the cached
+        # properties below) so module-tree-only callers never pay for it
         self.parsed_tree: dict[str, Any] | None = None
-        self.component_map: dict[str, Any] | None = None
-        self.reverse_deps: dict[str, list[str]] | None = None
 
         # Parse immediately
         self._parse()
 
     def _load_json(self, filepath: str) -> dict[str, Any]:
-        """Load and parse JSON file."""
-        with open(filepath, encoding="utf-8") as f:
-            return json.load(f)
+        """Load and parse JSON file (uses orjson when available)."""
+        data = Path(filepath).read_bytes()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def _iter_dependency_graph(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (component_id, component_data) pairs from the dependency graph.
+
+        Streams the file with ijson when available so the raw graph is never
+        materialized alongside the component map.
+        """
+        if ijson is None:
+            yield from self._load_json(self.dependency_graph_path).items()
+            return
+
+        with open(self.dependency_graph_path, "rb") as f:
+            yield from ijson.kvitems(f, "")
 
     def _parse(self) -> None:
-        """Parse all input data."""
+        """Parse the module tree."""
         self.parsed_tree = self.parse_module_tree()
-        self.component_map = self.build_component_map()
-        self.reverse_deps = self._build_reverse_dependencies()
+
+    @cached_property
+    def components(self) -> ComponentTable:
+        """Integer-indexed component table, built on first access."""
+        return self.build_component_table()
+
+    @cached_property
+    def component_map(self) -> dict[str, Any]:
+        """Component records keyed by component id, built on first access."""
+        return self.build_component_map()
+
+    @cached_property
+    def reverse_deps(self) -> dict[str, list[str]]:
+        """Reverse dependency map (who depends on each component)."""
+        return self.components.reverse_map()
 
     def parse_module_tree(self) -> dict[str, Any]:
         """Parse module tree into structured format."""
@@ -46,40 +280,49 @@ class GatomiaAnalyzer:
             "parent_modules": [],
             "root_modules": [],
             "component_to_module": {},
+            "max_level": 0,
         }
 
-        def traverse(
-            modules_dict: dict[str, Any],
-            parent_path: str | None = None,
-            level: int = 0,
-        ) -> None:
-            for module_path, module_data in modules_dict.items():
-                is_leaf = len(module_data.get("children", {})) == 0
-
-                result["modules"][module_path] = {
-                    "path": module_path,
-                    "components": module_data.get("components", []),
-                    "children": module_data.get("children", {}),
-                    "parent": parent_path,
-                    "is_leaf": is_leaf,
-                    "level": level,
-                }
-
-                if is_leaf:
-                    result["leaf_modules"].append(module_path)
-                else:
-                    result["parent_modules"].append(module_path)
+        # Explicit DFS stack of (children iterator, parent path, level); keeps the
+        # recursive pre-order without risking RecursionError on deep trees.
+        stack = [(iter(self.module_tree.items()), None, 0)]
+        while stack:
+            items, parent_path, level = stack[-1]
+            entry = next(items, None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            module_path, module_data = entry
+            components = module_data.get("components", [])
+            children = module_data.get("children", {})
+            is_leaf = len(children) == 0
+
+            result["modules"][module_path] = {
+                "path": module_path,
+                "components": components,
+                "children": children,
+                "parent": parent_path,
+                "is_leaf": is_leaf,
+                "level": level,
+            }
+            if level > result["max_level"]:
+                result["max_level"] = level
+
+            if is_leaf:
+                result["leaf_modules"].append(module_path)
+            else:
+                result["parent_modules"].append(module_path)
 
-                if parent_path is None:
-                    result["root_modules"].append(module_path)
+            if parent_path is None:
+                result["root_modules"].append(module_path)
 
-                for component_id in module_data.get("components", []):
-                    result["component_to_module"][component_id] = module_path
+            for component_id in components:
+                result["component_to_module"][component_id] = module_path
 
-                if module_data.get("children"):
-                    traverse(module_data["children"], module_path, level + 1)
+            if children:
+                stack.append((iter(children.items()), module_path, level + 1))
 
-        traverse(self.module_tree)
         return result
 
     def get_processing_order(self) -> list[list[str]]:
@@ -87,62 +330,44 @@ class GatomiaAnalyzer:
         if not self.parsed_tree:
             self.parsed_tree = self.parse_module_tree()
 
-        max_level = max(m["level"] for m in self.parsed_tree["modules"].values())
+        buckets: dict[int, list[str]] = defaultdict(list)
+        for path, info in self.parsed_tree["modules"].items():
+            buckets[info["level"]].append(path)
 
-        order = []
-        for level in range(max_level, -1, -1):
-            level_modules = [
-                path for path, info in self.parsed_tree["modules"].items() if info["level"] == level
-            ]
-            if level_modules:
-                order.append(level_modules)
+        return [buckets[level] for level in sorted(buckets, reverse=True)]
 
-        return order
+    def build_component_table(self) -> ComponentTable:
+        """Build the integer-indexed component table from the dependency graph."""
+        modules = list(self.parsed_tree["modules"]) if self.parsed_tree else []
+        component_to_module = self.parsed_tree["component_to_module"] if self.parsed_tree else {}
 
-    def build_component_map(self) -> dict[str, Any]:
-        """Build comprehensive component information map."""
-        comp_map = {}
-
-        for comp_id, comp_data in self.dependency_graph.items():
-            comp_map[comp_id] = {
-                "id": comp_data.get("id", comp_id),
-                "name": comp_data.get("name", comp_id.split(".")[-1]),
-                "component_type": comp_data.get("component_type", "unknown"),
-                "file_path": comp_data.get("file_path", ""),
-                "relative_path": comp_data.get("relative_path", ""),
-                "depends_on": comp_data.get("depends_on", []),
-                "depended_by": [],
-                "module": None,
-                "dependency_count": len(comp_data.get("depends_on", [])),
-                "dependent_count": 0,
-            }
+        table = ComponentTable(modules)
+        for comp_id, comp_data in self._iter_dependency_graph():
+            table.add(comp_id, comp_data, component_to_module.get(comp_id))
+        table.link()
 
+        member_modules: list[int] = []
+        member_components: list[int] = []
         if self.parsed_tree:
-            for comp_id in comp_map:
-                if comp_id in self.parsed_tree["component_to_module"]:
-                    comp_map[comp_id]["module"] = self.parsed_tree["component_to_module"][comp_id]
+            for module_idx, module_info in enumerate(self.parsed_tree["modules"].values()):
+                for comp_id in module_info["components"]:
+                    comp_idx = table.id_to_idx.get(comp_id)
+                    if comp_idx is not None:
+                        member_modules.append(module_idx)
+                        member_components.append(comp_idx)
+        table.count_module_edges(member_modules, member_components)
 
-        return comp_map
+        return table
 
-    def _build_reverse_dependencies(self) -> dict[str, list[str]]:
-        """Build reverse dependency map (who depends on each component)."""
-        reverse: dict[str, list[str]] = defaultdict(list)
-
-        if self.component_map:
-            for comp_id, comp_info in self.component_map.items():
-                for dep_id in comp_info["depends_on"]:
-                    reverse[dep_id].append(comp_id)
-
-            for comp_id, dependents in reverse.items():
-                if comp_id in self.component_map:
-                    self.component_map[comp_id]["depended_by"] = dependents
-                    self.component_map[comp_id]["dependent_count"] = len(dependents)
-
-        return dict(reverse)
+    def build_component_map(self) -> dict[str, Any]:
+        """Build comprehensive component information map."""
+        table = self.components
+        return {comp_id: table.record(idx) for idx, comp_id in enumerate(table.ids)}
 
     def analyze_dependencies(self, component_id: str) -> dict[str, Any]:
         """Analyze dependencies for a specific component."""
-        if not self.component_map or component_id not in self.component_map:
+        idx = self.components.id_to_idx.get(component_id)
+        if idx is None:
             return {
                 "error": f"Component {component_id} not found",
                 "internal_dependencies": [],
@@ -153,8 +378,10 @@ class GatomiaAnalyzer:
                 "dependent_modules": [],
             }
 
-        comp_info = self.component_map[component_id]
-        comp_module = comp_info["module"]
+        table = self.components
+        ids, names, types, module_of = table.ids, table.names, table.types, table.module_of
+        modules = table.modules
+        comp_module = module_of[idx]
 
         internal_deps = []
         external_deps = []
@@ -163,39 +390,37 @@ class GatomiaAnalyzer:
         dep_modules: set[str] = set()
         dependent_modules: set[str] = set()
 
-        for dep_id in comp_info["depends_on"]:
-            if dep_id in self.component_map:
-                dep_comp = self.component_map[dep_id]
-                dep_info = {
-                    "id": dep_id,
-                    "name": dep_comp["name"],
-                    "type": dep_comp["component_type"],
-                }
-
-                if dep_comp["module"] == comp_module:
-                    internal_deps.append(dep_info)
-                else:
-                    dep_info["module"] = dep_comp["module"]
-                    external_deps.append(dep_info)
-                    if dep_comp["module"]:
-                        dep_modules.add(dep_comp["module"])
-
-        for dependent_id in comp_info["depended_by"]:
-            if dependent_id in self.component_map:
-                dependent_comp = self.component_map[dependent_id]
-                dependent_info = {
-                    "id": dependent_id,
-                    "name": dependent_comp["name"],
-                    "type": dependent_comp["component_type"],
-                }
-
-                if dependent_comp["module"] == comp_module:
-                    internal_dependents.append(dependent_info)
-                else:
-                    dependent_info["module"] = dependent_comp["module"]
-                    external_dependents.append(dependent_info)
-                    if dependent_comp["module"]:
-                        dependent_modules.add(dependent_comp["module"])
+        for dep_idx in table.depends_on[idx]:
+            dep_info = {"id": ids[dep_idx], "name": names[dep_idx], "type": types[dep_idx]}
+            dep_module = module_of[dep_idx]
+
+            if dep_module == comp_module:
+                internal_deps.append(dep_info)
+            elif dep_module >= 0:
+                dep_info["module"] = modules[dep_module]
+                external_deps.append(dep_info)
+                dep_modules.add(modules[dep_module])
+            else:
+                dep_info["module"] = None
+                external_deps.append(dep_info)
+
+        for dependent_idx in table.depended_by[idx]:
+            dependent_info = {
+                "id": ids[dependent_idx],
+                "name": names[dependent_idx],
+                "type": types[dependent_idx],
+            }
+            dependent_module = module_of[dependent_idx]
+
+            if dependent_module == comp_module:
+                internal_dependents.append(dependent_info)
+            elif dependent_module >= 0:
+                dependent_info["module"] = modules[dependent_module]
+                external_dependents.append(dependent_info)
+                dependent_modules.add(modules[dependent_module])
+            else:
+                dependent_info["module"] = None
+                external_dependents.append(dependent_info)
 
         return {
             "internal_dependencies": internal_deps,
@@ -218,31 +443,39 @@ class GatomiaAnalyzer:
         external_deps_by_module: dict[str, list[dict[str, str]]] = defaultdict(list)
         external_dependents_by_module: dict[str, list[dict[str, str]]] = defaultdict(list)
 
+        table = self.components
+        ids, id_to_idx, module_of, modules = (
+            table.ids,
+            table.id_to_idx,
+            table.module_of,
+            table.modules,
+        )
+        module_idx = table.module_to_idx[module_path]
+
         for comp_id in components:
-            if not self.component_map or comp_id not in self.component_map:
+            idx = id_to_idx.get(comp_id)
+            if idx is None:
                 continue
 
-            comp_info = self.component_map[comp_id]
+            for dep_idx in table.depends_on[idx]:
+                dep_module = module_of[dep_idx]
 
-            for dep_id in comp_info["depends_on"]:
-                if dep_id in self.component_map:
-                    dep_module = self.component_map[dep_id]["module"]
+                if dep_module == module_idx:
+                    internal_deps.append(
+                        {"from": comp_id, "to": ids[dep_idx], "type": "depends_on"}
+                    )
+                elif dep_module >= 0:
+                    external_deps_by_module[modules[dep_module]].append(
+                        {"from_component": comp_id, "to_component": ids[dep_idx]}
+                    )
 
-                    if dep_module == module_path:
-                        internal_deps.append({"from": comp_id, "to": dep_id, "type": "depends_on"})
-                    elif dep_module:
-                        external_deps_by_module[dep_module].append(
-                            {"from_component": comp_id, "to_component": dep_id}
-                        )
+            for dependent_idx in table.depended_by[idx]:
+                dependent_module = module_of[dependent_idx]
 
-            for dependent_id in comp_info["depended_by"]:
-                if dependent_id in self.component_map:
-                    dependent_module = self.component_map[dependent_id]["module"]
-
-                    if dependent_module and dependent_module != module_path:
-                        external_dependents_by_module[dependent_module].append(
-                            {"from_component": dependent_id, "to_component": comp_id}
-                        )
+                if dependent_module >= 0 and dependent_module != module_idx:
+                    external_dependents_by_module[modules[dependent_module]].append(
+                        {"from_component": ids[dependent_idx], "to_component": comp_id}
+                    )
 
         external_deps = [
             {"target_module": mod, "relationships": rels}
@@ -254,15 +487,15 @@ class GatomiaAnalyzer:
             for mod, rels in external_dependents_by_module.items()
         ]
 
-        external_edge_count = sum(len(d["relationships"]) for d in external_deps)
-        internal_edge_count = len(internal_deps)
+        internal_edge_count = table.module_internal_edges[module_idx]
+        external_edge_count = table.module_external_edges[module_idx]
         total_edges = internal_edge_count + external_edge_count
 
         complexity = {
             "component_count": len(components),
             "internal_edge_count": internal_edge_count,
             "external_edge_count": external_edge_count,
-            "cohesion_score": internal_edge_count / total_edges if total_edges > 0 else 0.0,
+            "cohesion_score": internal_edge_count / max(total_edges, 1),
         }
 
         return {
@@ -276,47 +509,26 @@ class GatomiaAnalyzer:
 
     def infer_component_purpose(self, component_id: str) -> dict[str, Any]:
         """Infer the purpose of a component."""
-        if not self.component_map or component_id not in self.component_map:
+        idx = self.components.id_to_idx.get(component_id)
+        if idx is None:
             return {"error": f"Component {component_id} not found"}
 
-        comp_info = self.component_map[component_id]
-        name = comp_info["name"]
-        comp_type = comp_info["component_type"]
-        dep_count = comp_info["dependency_count"]
-        dependent_count = comp_info["dependent_count"]
+        table = self.components
+        name = table.names[idx]
+        comp_type = table.types[idx]
+        unresolved = table.unresolved_depends_on.get(idx)
+        dep_count = len(unresolved if unresolved is not None else table.depends_on[idx])
+        dependent_count = len(table.depended_by[idx])
 
         role = "unknown"
         confidence = 0.5
         reasoning = []
 
-        name_lower = name.lower()
-
-        role_patterns = {
-            "manager": ("manager", 0.8, "manages resources or lifecycle"),
-            "service": ("service", 0.8, "provides business logic"),
-            "generator": ("generator", 0.8, "object creation or construction"),
-            "builder": ("generator", 0.8, "object creation or construction"),
-            "analyzer": ("analyzer", 0.8, "data analysis or transformation"),
-            "parser": ("analyzer", 0.8, "data analysis or transformation"),
-            "handler": ("processor", 0.7, "event handling or data processing"),
-            "processor": ("processor", 0.7, "event handling or data processing"),
-            "adapter": ("adapter", 0.8, "interface adaptation or wrapping"),
-            "wrapper": ("adapter", 0.8, "interface adaptation or wrapping"),
-            "model": ("model", 0.7, "data structure or entity"),
-            "entity": ("model", 0.7, "data structure or entity"),
-            "dto": ("model", 0.7, "data structure or entity"),
-            "util": ("utility", 0.7, "helper functions"),
-            "helper": ("utility", 0.7, "helper functions"),
-            "config": ("configuration", 0.8, "configuration management"),
-            "settings": ("configuration", 0.8, "configuration management"),
-        }
-
-        for pattern, (r, c, desc) in role_patterns.items():
-            if pattern in name_lower:
-                role = r
-                confidence = c
-                reasoning.append(f'Name contains "{pattern}" - likely {desc}')
-                break
+        matches = [m.group(1) for m in self._ROLE_RE.finditer(table.names_lower[idx])]
+        if matches:
+            pattern = min(matches, key=self._ROLE_PRIORITY.__getitem__)
+            role, confidence, desc = self.ROLE_PATTERNS[pattern]
+            reasoning.append(f'Name contains "{pattern}" - likely {desc}')
 
         if dep_count == 0:
             if role == "unknown":
@@ -363,21 +575,8 @@ class GatomiaAnalyzer:
         dependent_count: int,
     ) -> str:
         """Generate a concise purpose description."""
-        role_descriptions = {
-            "manager": f"{name} manages lifecycle and resources",
-            "service": f"{name} provides business logic and operations",
-            "generator": f"{name} creates or constructs objects/data",
-            "analyzer": f"{name} analyzes or transforms data",
-            "processor": f"{name} processes data or handles events",
-            "adapter": f"{name} adapts or wraps external interfaces",
-            "model": f"{name} represents data structure or entity",
-            "utility": f"{name} provides helper functions",
-            "configuration": f"{name} manages configuration settings",
-            "controller": f"{name} orchestrates operations",
-            "unknown": f"{name} ({comp_type})",
-        }
-
-        return role_descriptions.get(role, role_descriptions["unknown"])
+        template = self.ROLE_DESCRIPTIONS.get(role, self.ROLE_DESCRIPTIONS["unknown"])
+        return template.format(name=name, comp_type=comp_type)
 
     def generate_analysis_report(self, module_path: str) -> dict[str, Any]:
         """Generate comprehensive analysis report for a module."""
@@ -402,15 +601,17 @@ class GatomiaAnalyzer:
             "components": {},
         }
 
+        table = self.components
         for comp_id in module_info["components"]:
-            if not self.component_map or comp_id not in self.component_map:
+            idx = table.id_to_idx.get(comp_id)
+            if idx is None:
                 continue
 
             comp_deps = self.analyze_dependencies(comp_id)
             purpose = self.infer_component_purpose(comp_id)
 
             report["components"][comp_id] = {
-                "info": self.component_map[comp_id],
+                "info": table.record(idx),
                 "dependencies": comp_deps,
                 "purpose": purpose,
             }
@@ -419,7 +620,7 @@ class GatomiaAnalyzer:
 
     def get_repository_summary(self) -> dict[str, Any]:
         """Get high-level repository summary."""
-        if not self.parsed_tree or not self.component_map:
+        if not self.parsed_tree or not self.components:
             return {"error": "Data not parsed"}
 
         return {
@@ -427,8 +628,8 @@ class GatomiaAnalyzer:
             "leaf_modules": len(self.parsed_tree["leaf_modules"]),
             "parent_modules": len(self.parsed_tree["parent_modules"]),
             "root_modules": len(self.parsed_tree["root_modules"]),
-            "total_components": len(self.component_map),
-            "max_depth": max(m["level"] for m in self.parsed_tree["modules"].values()),
+            "total_components": len(self.components),
+            "max_depth": self.parsed_tree["max_level"],
             "processing_order_levels": len(self.get_processing_order()),
         }
 
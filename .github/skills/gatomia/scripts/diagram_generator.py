@@ -5,9 +5,17 @@ Generates Mermaid diagrams for code documentation.
 """
 
 import json
+from collections.abc import Iterator
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator
+    orjson = None
+
 
 class DiagramGenerator:
     """Generates Mermaid diagrams for GatomIA documentation."""
@@ -17,19 +25,55 @@ class DiagramGenerator:
         module_tree_path: str | None = None,
         dependency_graph_path: str | None = None,
     ):
-        """Initialize diagram generator."""
-        self.module_tree: dict[str, Any] = {}
-        self.dependency_graph: dict[str, Any] = {}
+        """Initialize diagram generator.
+
+        Input files are only read when a diagram that needs them is generated.
+        """
+        self.module_tree_path = module_tree_path
+        self.dependency_graph_path = dependency_graph_path
+
+    @cached_property
+    def module_tree(self) -> dict[str, Any]:
+        """Module tree, loaded on first access."""
+        return self._load_json(self.module_tree_path) if self.module_tree_path else {}
+
+    @cached_property
+    def dependency_graph(self) -> dict[str, Any]:
+        """Dependency graph, loaded on first access."""
+        return self._load_json(self.dependency_graph_path) if self.dependency_graph_path else {}
 
-        if module_tree_path:
-            self.module_tree = self._load_json(module_tree_path)
-        if dependency_graph_path:
-            self.dependency_graph = self._load_json(dependency_graph_path)
+    @cached_property
+    def _module_index(self) -> dict[str, dict[str, Any]]:
+        """Flat {module_path: module_data} index, built on first access."""
+        return self._build_module_index()
 
     def _load_json(self, filepath: str) -> dict[str, Any]:
-        """Load and parse JSON file."""
-        with open(filepath, encoding="utf-8") as f:
-            return json.load(f)
+        """Load and parse JSON file (uses orjson when available)."""
+        data = Path(filepath).read_bytes()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def _build_module_index(self) -> dict[str, dict[str, Any]]:
+        """Flatten the module tree into a {module_path: module_data} index.
+
+        Walks in pre-order, like a recursive search, so when a path occurs more
+        than once the first occurrence in the tree wins.
+        """
+        index: dict[str, dict[str, Any]] = {}
+        stack = [iter(self.module_tree.items())]
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            path, data = entry
+            index.setdefault(path, data)
+            children = data.get("children", {})
+            if children:
+                stack.append(iter(children.items()))
+        return index
 
     def generate_architecture_diagram(
         self,
@@ -37,78 +81,72 @@ class DiagramGenerator:
         max_depth: int = 2,
     ) -> str:
         """Generate architecture diagram for a module or entire repository."""
-        diagram = "```mermaid\ngraph TB\n"
+        return "".join(self.iter_architecture_diagram(module_path, max_depth))
+
+    def iter_architecture_diagram(
+        self,
+        module_path: str | None = None,
+        max_depth: int = 2,
+    ) -> Iterator[str]:
+        """Yield architecture diagram lines, so large trees can be streamed to a file."""
+        yield "```mermaid\ngraph TB\n"
 
         if module_path:
-            diagram += self._generate_module_architecture(module_path, max_depth)
+            yield from self._iter_module_architecture(module_path, max_depth)
         else:
-            diagram += self._generate_repository_architecture(max_depth)
-
-        diagram += "```"
-        return diagram
+            yield from self._iter_repository_architecture(max_depth)
 
-    def _generate_repository_architecture(self, max_depth: int) -> str:
-        """Generate architecture for entire repository."""
-        lines = []
+        yield "```"
 
-        def traverse(
-            modules: dict[str, Any],
-            parent_id: str | None = None,
-            depth: int = 0,
-        ) -> None:
-            if depth >= max_depth:
-                return
+    def _iter_repository_architecture(self, max_depth: int) -> Iterator[str]:
+        """Yield architecture lines for entire repository."""
+        empty = True
 
-            for idx, (module_path, module_data) in enumerate(modules.items()):
-                node_id = f"M{depth}_{idx}"
-                safe_name = module_path.replace("/", "_").replace("-", "_")
-                lines.append(f'    {node_id}["{module_path}"]')
+        # Explicit DFS stack of (enumerated children iterator, parent node, depth)
+        stack = [(enumerate(self.module_tree.items()), None, 0)] if max_depth > 0 else []
+        while stack:
+            items, parent_id, depth = stack[-1]
+            entry = next(items, None)
+            if entry is None:
+                stack.pop()
+                continue
 
-                if parent_id:
-                    lines.append(f"    {parent_id} --> {node_id}")
+            idx, (module_path, module_data) = entry
+            node_id = f"M{depth}_{idx}"
+            yield f'    {node_id}["{module_path}"]\n'
+            empty = False
 
-                children = module_data.get("children", {})
-                if children:
-                    traverse(children, node_id, depth + 1)
+            if parent_id:
+                yield f"    {parent_id} --> {node_id}\n"
 
-        traverse(self.module_tree)
-        return "\n".join(lines) + "\n"
+            children = module_data.get("children", {})
+            if children and depth + 1 < max_depth:
+                stack.append((enumerate(children.items()), node_id, depth + 1))
 
-    def _generate_module_architecture(self, module_path: str, max_depth: int) -> str:
-        """Generate architecture for a specific module."""
-        lines = []
+        if empty:
+            # Keep the blank body line an empty diagram has always had
+            yield "\n"
 
+    def _iter_module_architecture(self, module_path: str, max_depth: int) -> Iterator[str]:
+        """Yield architecture lines for a specific module."""
         module_data = self._find_module(module_path)
         if not module_data:
-            return f'    Error["Module {module_path} not found"]\n'
+            yield f'    Error["Module {module_path} not found"]\n'
+            return
 
         node_id = "Root"
-        lines.append(f'    {node_id}["{module_path}"]')
+        yield f'    {node_id}["{module_path}"]\n'
 
         for idx, comp_id in enumerate(module_data.get("components", [])):
             comp_node = f"C{idx}"
-            comp_name = comp_id.split(".")[-1] if "." in comp_id else comp_id
-            lines.append(f'    {comp_node}["{comp_name}"]')
-            lines.append(f"    {node_id} --> {comp_node}")
-            lines.append(f"    style {comp_node} fill:#e1f5ff")
-
-        return "\n".join(lines) + "\n"
+            comp_name = comp_id.rpartition(".")[2]
+            yield f'    {comp_node}["{comp_name}"]\n'
+            yield f"    {node_id} --> {comp_node}\n"
+            yield f"    style {comp_node} fill:#e1f5ff\n"
 
     def _find_module(self, module_path: str) -> dict[str, Any] | None:
         """Find a module in the tree by path."""
-
-        def search(modules: dict[str, Any]) -> dict[str, Any] | None:
-            for path, data in modules.items():
-                if path == module_path:
-                    return data
-                children = data.get("children", {})
-                if children:
-                    result = search(children)
-                    if result:
-                        return result
-            return None
-
-        return search(self.module_tree)
+        return self._module_index.get(module_path)
 
     def generate_dependency_diagram(
         self,
@@ -116,36 +154,42 @@ class DiagramGenerator:
         max_nodes: int = 20,
     ) -> str:
         """Generate dependency diagram for components."""
-        diagram = "```mermaid\ngraph LR\n"
+        return "".join(self.iter_dependency_diagram(component_ids, max_nodes))
+
+    def iter_dependency_diagram(
+        self,
+        component_ids: list[str] | None = None,
+        max_nodes: int = 20,
+    ) -> Iterator[str]:
+        """Yield dependency diagram lines, so large graphs can be streamed to a file."""
+        yield "```mermaid\ngraph LR\n"
 
         if component_ids:
             components = {cid: self.dependency_graph.get(cid, {}) for cid in component_ids}
         else:
-            items = list(self.dependency_graph.items())[:max_nodes]
-            components = dict(items)
+            components = dict(islice(self.dependency_graph.items(), max_nodes))
 
         node_map = {}
+        edge_sources: list[tuple[str, list[str]]] = []
         for idx, (comp_id, comp_data) in enumerate(components.items()):
             node_id = f"N{idx}"
             node_map[comp_id] = node_id
-            comp_name = comp_data.get("name", comp_id.split(".")[-1])
-            diagram += f'    {node_id}["{comp_name}"]\n'
-
-        for comp_id, comp_data in components.items():
-            from_id = node_map.get(comp_id)
-            if not from_id:
-                continue
-
-            for dep_id in comp_data.get("depends_on", []):
-                to_id = node_map.get(dep_id)
+            comp_name = comp_data.get("name") or comp_id.rpartition(".")[2]
+            yield f'    {node_id}["{comp_name}"]\n'
+            edge_sources.append((node_id, comp_data.get("depends_on", [])))
+
+        # Edges can point at nodes declared later, so resolve them once all ids exist
+        node_get = node_map.get
+        for from_id, depends_on in edge_sources:
+            for dep_id in depends_on:
+                to_id = node_get(dep_id)
                 if to_id:
-                    diagram += f"    {from_id} --> {to_id}\n"
+                    yield f"    {from_id} --> {to_id}\n"
 
         for node_id in node_map.values():
-            diagram += f"    style {node_id} fill:#e1f5ff\n"
+            yield f"    style {node_id} fill:#e1f5ff\n"
 
-        diagram += "```"
-        return diagram
+        yield "```"
 
     def generate_sequence_diagram(
         self,
@@ -161,16 +205,24 @@ class DiagramGenerator:
         Returns:
             Mermaid sequence diagram
         """
+        return "".join(self.iter_sequence_diagram(flow, title))
+
+    def iter_sequence_diagram(
+        self,
+        flow: list[dict[str, str]],
+        title: str = "Interaction Flow",
+    ) -> Iterator[str]:
+        """Yield sequence diagram lines (see generate_sequence_diagram)."""
         participants = set()
         for step in flow:
             participants.add(step["from"])
             participants.add(step["to"])
 
-        diagram = "```mermaid\nsequenceDiagram\n"
+        yield "```mermaid\nsequenceDiagram\n"
 
         for participant in sorted(participants):
             safe_name = participant.replace(" ", "_")
-            diagram += f"    participant {safe_name} as {participant}\n"
+            yield f"    participant {safe_name} as {participant}\n"
 
         for step in flow:
             from_name = step["from"].replace(" ", "_")
@@ -178,12 +230,11 @@ class DiagramGenerator:
             action = step.get("action", "")
             response = step.get("response")
 
-            diagram += f"    {from_name}->>{to_name}: {action}\n"
+            yield f"    {from_name}->>{to_name}: {action}\n"
             if response:
-                diagram += f"    {to_name}-->>{from_name}: {response}\n"
+                yield f"    {to_name}-->>{from_name}: {response}\n"
 
-        diagram += "```"
-        return diagram
+        yield "```"
 
     def generate_data_flow_diagram(
         self,
@@ -199,7 +250,15 @@ class DiagramGenerator:
         Returns:
             Mermaid flowchart
         """
-        diagram = "```mermaid\nflowchart LR\n"
+        return "".join(self.iter_data_flow_diagram(nodes, edges))
+
+    def iter_data_flow_diagram(
+        self,
+        nodes: list[dict[str, str]],
+        edges: list[dict[str, str]],
+    ) -> Iterator[str]:
+        """Yield data flow diagram lines (see generate_data_flow_diagram)."""
+        yield "```mermaid\nflowchart LR\n"
 
         type_shapes = {
             "input": "([{label}])",
@@ -214,7 +273,7 @@ class DiagramGenerator:
             label = node["label"]
             node_type = node.get("type", "process")
             shape = type_shapes.get(node_type, "[{label}]")
-            diagram += f"    {node_id}{shape.format(label=label)}\n"
+            yield f"    {node_id}{shape.format(label=label)}\n"
 
         for edge in edges:
             from_id = edge["from"]
@@ -222,12 +281,11 @@ class DiagramGenerator:
             label = edge.get("label", "")
 
             if label:
-                diagram += f"    {from_id} -->|{label}| {to_id}\n"
+                yield f"    {from_id} -->|{label}| {to_id}\n"
             else:
-                diagram += f"    {from_id} --> {to_id}\n"
+                yield f"    {from_id} --> {to_id}\n"
 
-        diagram += "```"
-        return diagram
+        yield "```"
 
     def generate_class_diagram(
         self,
@@ -243,19 +301,27 @@ class DiagramGenerator:
         Returns:
             Mermaid class diagram
         """
-        diagram = "```mermaid\nclassDiagram\n"
+        return "".join(self.iter_class_diagram(classes, relationships))
+
+    def iter_class_diagram(
+        self,
+        classes: list[dict[str, Any]],
+        relationships: list[dict[str, str]] | None = None,
+    ) -> Iterator[str]:
+        """Yield class diagram lines (see generate_class_diagram)."""
+        yield "```mermaid\nclassDiagram\n"
 
         for cls in classes:
             class_name = cls["name"]
-            diagram += f"    class {class_name} {{\n"
+            yield f"    class {class_name} {{\n"
 
             for attr in cls.get("attributes", []):
-                diagram += f"        {attr}\n"
+                yield f"        {attr}\n"
 
             for method in cls.get("methods", []):
-                diagram += f"        {method}()\n"
+                yield f"        {method}()\n"
 
-            diagram += "    }\n"
+            yield "    }\n"
 
         if relationships:
             rel_symbols = {
@@ -271,10 +337,9 @@ class DiagramGenerator:
                 to_cls = rel["to"]
                 rel_type = rel.get("type", "association")
                 symbol = rel_symbols.get(rel_type, "--")
-                diagram += f"    {from_cls} {symbol} {to_cls}\n"
+                yield f"    {from_cls} {symbol} {to_cls}\n"
 
-        diagram += "```"
-        return diagram
+        yield "```"
 
 
 def main() -> None:
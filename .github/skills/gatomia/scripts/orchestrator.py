@@ -6,27 +6,68 @@ Coordinates the entire documentation generation process.
 
 import json
 import os
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from codewiki_analyzer import GatomiaAnalyzer
 
+# Below this many leaf modules, process start-up costs more than it saves.
+# Each worker re-parses both JSON inputs and holds its own analyzer, so the
+# pool is also capped at the number of leaves to bound memory.
+PARALLEL_MIN_LEAVES = 8
+
+# Per-process orchestrator used by leaf-doc workers, built once by _init_leaf_worker
+_worker_orchestrator: "GatomiaOrchestrator | None" = None
+
+
+def _init_leaf_worker(module_tree_path: str, dependency_graph_path: str, output_dir: str) -> None:
+    """Build the analyzer once per worker process."""
+    global _worker_orchestrator
+    _worker_orchestrator = GatomiaOrchestrator(
+        module_tree_path, dependency_graph_path, output_dir, max_workers=1
+    )
+
+
+def _build_leaf_doc(module_path: str) -> tuple[str, str, str]:
+    """Build a leaf doc in a worker; returns (module_path, markdown, summary) without writing."""
+    assert _worker_orchestrator is not None
+    return (module_path, *_worker_orchestrator._build_leaf_module_doc(module_path))
+
 
 class GatomiaOrchestrator:
     """Orchestrates the GatomIA documentation generation process."""
 
+    _TOP_PURPOSE_ROLES = frozenset(("analyzer", "parser"))
+
     def __init__(
         self,
         module_tree_path: str,
         dependency_graph_path: str,
         output_dir: str = "./docs",
+        max_workers: int | None = None,
     ):
-        """Initialize orchestrator."""
+        """Initialize orchestrator; max_workers=1 disables parallel leaf generation."""
         self.analyzer = GatomiaAnalyzer(module_tree_path, dependency_graph_path)
+        self._worker_args = (module_tree_path, dependency_graph_path, output_dir)
+        self.max_workers = max_workers
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         self.generated_docs: dict[str, Path] = {}
+        # Overview summaries per doc path, computed once from the markdown we produced
+        self._summary_cache: dict[Path, str] = {}
+        # Relative links keyed by (from_dir, to_path); the same links recur across pages
+        self._relpath_cache: dict[tuple[str, str], str] = {}
+        # Directories already created this run, so each is mkdir'ed once
+        self._mkdir_done: set[Path] = {self.output_dir}
+        # The module tree does not change during generation, so children are listed once
+        modules = self.analyzer.parsed_tree["modules"] if self.analyzer.parsed_tree else {}
+        self._children_map: dict[str, list[str]] = {
+            path: list(info["children"]) for path, info in modules.items()
+        }
 
     def generate_all_documentation(self) -> None:
         """Generate complete documentation suite."""
@@ -43,23 +84,27 @@ class GatomiaOrchestrator:
         processing_order = self.analyzer.get_processing_order()
         print(f"  Levels to process: {len(processing_order)}")
 
-        print("\nStep 3: Generating leaf module documentation...")
-        leaf_count = 0
-        for module_path in processing_order[0]:
-            self._generate_leaf_module_doc(module_path)
-            leaf_count += 1
-            print(f"  [{leaf_count}/{len(processing_order[0])}] {module_path}")
-
-        if len(processing_order) > 1:
-            print("\nStep 4: Generating parent module documentation...")
-            parent_count = 0
-            total_parents = sum(len(level) for level in processing_order[1:])
-
-            for level_idx, level_modules in enumerate(processing_order[1:], 1):
-                for module_path in level_modules:
-                    self._generate_parent_module_doc(module_path)
-                    parent_count += 1
-                    print(f"  [{parent_count}/{total_parents}] Level {level_idx}: {module_path}")
+        # Per-module progress goes through one bound write and is flushed per phase
+        write = sys.stdout.write
+        leaf_total = len(processing_order[0]) if processing_order else 0
+        parent_total = sum(map(len, processing_order[1:]))
+
+        # Level 0 is the leaf phase, every later level is part of the parent phase
+        done = total = 0
+        for level_idx, level_modules in enumerate(processing_order):
+            if level_idx == 0:
+                print("\nStep 3: Generating leaf module documentation...")
+                total = leaf_total
+            elif level_idx == 1:
+                sys.stdout.flush()
+                print("\nStep 4: Generating parent module documentation...")
+                done, total = 0, parent_total
+
+            label = f"Level {level_idx}: " if level_idx else ""
+            for module_path in self._iter_level_docs(level_idx, level_modules):
+                done += 1
+                write(f"  [{done}/{total}] {label}{module_path}\n")
+        sys.stdout.flush()
 
         print("\nStep 5: Generating repository overview...")
         self._generate_repository_overview()
@@ -74,13 +119,48 @@ class GatomiaOrchestrator:
         print(f"Total files: {len(self.generated_docs)}")
         print("=" * 60)
 
-    def _generate_leaf_module_doc(self, module_path: str) -> None:
-        """Generate documentation for a leaf module."""
+    def _iter_level_docs(self, level_idx: int, module_paths: list[str]) -> Iterator[str]:
+        """Generate and store the docs for one level, yielding each module path when done."""
+        if level_idx == 0:
+            for module_path, markdown, summary in self._iter_leaf_docs(module_paths):
+                self._store_leaf_module_doc(module_path, markdown, summary)
+                yield module_path
+        else:
+            for module_path in module_paths:
+                self._generate_parent_module_doc(module_path)
+                yield module_path
+
+    def _iter_leaf_docs(self, module_paths: list[str]) -> Iterator[tuple[str, str, str]]:
+        """Yield (module_path, markdown, summary) for leaf modules, in order.
+
+        Leaves are independent of each other, so large batches are built in a
+        process pool; writing and bookkeeping stay in this process.
+        """
+        workers = min(self.max_workers or os.cpu_count() or 1, len(module_paths))
+        if workers <= 1 or len(module_paths) < PARALLEL_MIN_LEAVES:
+            for module_path in module_paths:
+                yield (module_path, *self._build_leaf_module_doc(module_path))
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_leaf_worker,
+            initargs=self._worker_args,
+        ) as executor:
+            chunksize = max(1, len(module_paths) // (workers * 4))
+            yield from executor.map(_build_leaf_doc, module_paths, chunksize=chunksize)
+
+    def _build_leaf_module_doc(self, module_path: str) -> tuple[str, str]:
+        """Build leaf module markdown and its overview summary without touching disk."""
         report = self.analyzer.generate_analysis_report(module_path)
         markdown = self._format_leaf_module_markdown(report)
+        return markdown, self._extract_module_summary_from_content(markdown)
 
+    def _store_leaf_module_doc(self, module_path: str, markdown: str, summary: str) -> None:
+        """Write a built leaf doc and record it."""
         output_path = self._get_module_doc_path(module_path)
         self._save_documentation(output_path, markdown)
+        self._summary_cache[output_path] = summary
         self.generated_docs[module_path] = output_path
 
     def _generate_parent_module_doc(self, module_path: str) -> None:
@@ -90,15 +170,21 @@ class GatomiaOrchestrator:
 
         module_info = self.analyzer.parsed_tree["modules"][module_path]
 
-        child_docs = {}
+        # Only the children's paths and cached summaries are needed, never their full docs
+        child_paths = {}
+        child_summaries = {}
         for child_path in self._get_child_modules(module_path):
             if child_path in self.generated_docs:
-                child_docs[child_path] = self._load_documentation(self.generated_docs[child_path])
+                doc_path = child_paths[child_path] = self.generated_docs[child_path]
+                child_summaries[child_path] = self._extract_module_summary(doc_path)
 
-        markdown = self._format_parent_module_markdown(module_path, module_info, child_docs)
+        markdown = self._format_parent_module_markdown(
+            module_path, module_info, child_summaries, child_paths
+        )
 
         output_path = self._get_module_doc_path(module_path)
         self._save_documentation(output_path, markdown)
+        self._summary_cache[output_path] = self._extract_module_summary_from_content(markdown)
         self.generated_docs[module_path] = output_path
 
     def _generate_repository_overview(self) -> None:
@@ -123,87 +209,86 @@ class GatomiaOrchestrator:
 
     def _generate_navigation(self) -> None:
         """Generate navigation index."""
-        nav_content = "# Documentation Index\n\n"
-        nav_content += "## Module Documentation\n\n"
+        parts = ["# Documentation Index\n\n", "## Module Documentation\n\n"]
 
         if not self.analyzer.parsed_tree:
             return
 
-        for module_path in sorted(self.generated_docs.keys()):
-            if module_path.startswith("_"):
-                continue
-
-            level = self.analyzer.parsed_tree["modules"][module_path]["level"]
+        modules = self.analyzer.parsed_tree["modules"]
+        # Drop internal entries (e.g. "_repository_overview") before sorting, not inside the loop
+        nav_keys = sorted(k for k in self.generated_docs if not k.startswith("_"))
+        for module_path in nav_keys:
+            level = modules[module_path]["level"]
             indent = "  " * level
             rel_path = self._get_relative_path(
                 self.output_dir / "INDEX.md", self.generated_docs[module_path]
             )
 
-            nav_content += f"{indent}- [{module_path}]({rel_path})\n"
+            parts.append(f"{indent}- [{module_path}]({rel_path})\n")
 
         output_path = self.output_dir / "INDEX.md"
-        self._save_documentation(output_path, nav_content)
+        self._save_documentation(output_path, "".join(parts))
 
     def _format_leaf_module_markdown(self, report: dict[str, Any]) -> str:
         """Format leaf module documentation as markdown."""
         cohesion = report.get("complexity", {}).get("cohesion_score", 0) * 100
 
-        md = f"# Module: {report['module']}\n\n"
+        parts = [f"# Module: {report['module']}\n\n"]
 
-        md += "## Overview\n\n"
-        md += f"This module contains {report['summary']['component_count']} components "
-        md += f"with a cohesion score of {cohesion:.1f}%. "
-        md += self._infer_module_purpose(report) + "\n\n"
+        parts.append("## Overview\n\n")
+        parts.append(f"This module contains {report['summary']['component_count']} components ")
+        parts.append(f"with a cohesion score of {cohesion:.1f}%. ")
+        parts.append(self._infer_module_purpose(report) + "\n\n")
 
-        md += "## Architecture\n\n"
-        md += self._generate_component_diagram(report) + "\n\n"
+        parts.append("## Architecture\n\n")
+        parts.extend((self._generate_component_diagram(report), "\n\n"))
 
-        md += "## Components\n\n"
+        parts.append("## Components\n\n")
         for comp_id, comp_data in report.get("components", {}).items():
-            md += self._format_component_section(comp_id, comp_data)
+            parts.extend(self._format_component_section(comp_id, comp_data))
 
         if report.get("dependencies"):
-            md += "## External Dependencies\n\n"
+            parts.append("## External Dependencies\n\n")
             for dep in report["dependencies"]:
-                md += f"### {dep['target_module']}\n"
-                md += f"- {len(dep['relationships'])} relationship(s)\n\n"
+                parts.append(f"### {dep['target_module']}\n")
+                parts.append(f"- {len(dep['relationships'])} relationship(s)\n\n")
 
         if report.get("dependents"):
-            md += "## Used By\n\n"
+            parts.append("## Used By\n\n")
             for dep in report["dependents"]:
-                md += f"### {dep['source_module']}\n"
-                md += f"- {len(dep['relationships'])} relationship(s)\n\n"
+                parts.append(f"### {dep['source_module']}\n")
+                parts.append(f"- {len(dep['relationships'])} relationship(s)\n\n")
 
-        return md
+        return "".join(parts)
 
     def _format_parent_module_markdown(
         self,
         module_path: str,
         module_info: dict[str, Any],
-        child_docs: dict[str, str],
+        child_summaries: dict[str, str],
+        child_paths: dict[str, Path],
     ) -> str:
         """Format parent module documentation as markdown."""
-        md = f"# Module: {module_path}\n\n"
+        parts = [f"# Module: {module_path}\n\n"]
 
-        md += "## Overview\n\n"
-        md += f"This is a parent module containing {len(module_info['children'])} submodules. "
-        md += self._infer_parent_module_purpose(module_path, child_docs) + "\n\n"
+        parts.append("## Overview\n\n")
+        parts.append(
+            f"This is a parent module containing {len(module_info['children'])} submodules. "
+        )
+        parts.append(self._infer_parent_module_purpose(module_path, child_summaries) + "\n\n")
 
-        md += "## Architecture\n\n"
-        md += self._generate_module_hierarchy_diagram(module_path) + "\n\n"
+        parts.append("## Architecture\n\n")
+        parts.extend((self._generate_module_hierarchy_diagram(module_path), "\n\n"))
 
-        md += "## Submodules\n\n"
-        for child_path in self._get_child_modules(module_path):
-            if child_path in child_docs:
-                summary = self._extract_module_summary_from_content(child_docs[child_path])
-                rel_path = self._get_relative_path(
-                    self._get_module_doc_path(module_path),
-                    self.generated_docs[child_path],
-                )
-                md += f"### [{child_path}]({rel_path})\n"
-                md += f"{summary}\n\n"
+        parts.append("## Submodules\n\n")
+        doc_path = self._get_module_doc_path(module_path)
+        for child_path in module_info["children"]:
+            if child_path in child_paths:
+                rel_path = self._get_relative_path(doc_path, child_paths[child_path])
+                parts.append(f"### [{child_path}]({rel_path})\n")
+                parts.append(f"{child_summaries[child_path]}\n\n")
 
-        return md
+        return "".join(parts)
 
     def _format_repository_overview_markdown(
         self,
@@ -211,49 +296,54 @@ class GatomiaOrchestrator:
         module_summaries: dict[str, str],
     ) -> str:
         """Format repository overview documentation as markdown."""
-        md = "# Repository Documentation\n\n"
+        parts = ["# Repository Documentation\n\n"]
 
-        md += "## Purpose\n\n"
-        md += "This repository contains a modular software system organized into "
-        md += (
+        parts.append("## Purpose\n\n")
+        parts.append("This repository contains a modular software system organized into ")
+        parts.append(
             f"{summary['total_modules']} modules with {summary['total_components']} components.\n\n"
         )
 
-        md += "## Architecture Overview\n\n"
-        md += f"The system is organized in a {summary['max_depth']}-level hierarchy:\n\n"
-        md += self._generate_repository_architecture_diagram() + "\n\n"
-
-        md += "## Module Structure\n\n"
-        for module_path, module_summary in module_summaries.items():
-            if module_path in self.generated_docs:
-                rel_path = self._get_relative_path(
-                    self.output_dir / "README.md", self.generated_docs[module_path]
-                )
-                md += f"### [{module_path}]({rel_path})\n"
-                md += f"{module_summary}\n\n"
-
-        md += "## Getting Started\n\n"
-        md += "Start by exploring the root modules:\n\n"
+        parts.append("## Architecture Overview\n\n")
+        parts.append(f"The system is organized in a {summary['max_depth']}-level hierarchy:\n\n")
+        parts.extend((self._generate_repository_architecture_diagram(), "\n\n"))
 
+        # One pass over the root modules feeds both the structure and getting-started sections
+        structure_parts = []
+        start_parts = []
         if self.analyzer.parsed_tree:
+            readme_path = self.output_dir / "README.md"
             for module_path in self.analyzer.parsed_tree["root_modules"]:
-                if module_path in self.generated_docs:
-                    rel_path = self._get_relative_path(
-                        self.output_dir / "README.md", self.generated_docs[module_path]
-                    )
-                    md += f"- [{module_path}]({rel_path})\n"
+                if module_path not in self.generated_docs:
+                    continue
+                rel_path = self._get_relative_path(readme_path, self.generated_docs[module_path])
+                if module_path in module_summaries:
+                    structure_parts.append(f"### [{module_path}]({rel_path})\n")
+                    structure_parts.append(f"{module_summaries[module_path]}\n\n")
+                start_parts.append(f"- [{module_path}]({rel_path})\n")
+
+        parts.append("## Module Structure\n\n")
+        parts.extend(structure_parts)
+
+        parts.append("## Getting Started\n\n")
+        parts.append("Start by exploring the root modules:\n\n")
+        parts.extend(start_parts)
 
-        return md
+        return "".join(parts)
 
     def _infer_module_purpose(self, report: dict[str, Any]) -> str:
         """Infer module purpose from components."""
-        roles = []
+        roles: set[str] = set()
         for comp_data in report.get("components", {}).values():
             purpose = comp_data.get("purpose", {})
             if "role" in purpose:
-                roles.append(purpose["role"])
+                role = purpose["role"]
+                roles.add(role)
+                # Nothing outranks these, so the remaining components cannot change the answer
+                if role in self._TOP_PURPOSE_ROLES:
+                    break
 
-        if "analyzer" in roles or "parser" in roles:
+        if roles & self._TOP_PURPOSE_ROLES:
             return "It provides data analysis and parsing capabilities."
         elif "service" in roles:
             return "It implements business logic and services."
@@ -264,7 +354,9 @@ class GatomiaOrchestrator:
         else:
             return "It provides core functionality for the system."
 
-    def _infer_parent_module_purpose(self, module_path: str, child_docs: dict[str, str]) -> str:
+    def _infer_parent_module_purpose(
+        self, module_path: str, child_summaries: dict[str, str]
+    ) -> str:
         """Infer parent module purpose from children."""
         if "fe" in module_path.lower():
             return "It manages the frontend layer of the application."
@@ -277,80 +369,72 @@ class GatomiaOrchestrator:
 
     def _generate_component_diagram(self, report: dict[str, Any]) -> str:
         """Generate Mermaid diagram for components."""
-        diagram = "```mermaid\ngraph LR\n"
-
-        comp_nodes = {}
-        for idx, comp_id in enumerate(report.get("components", {})):
-            node_id = f"C{idx}"
-            comp_name = report["components"][comp_id]["info"]["name"]
-            comp_nodes[comp_id] = node_id
-            diagram += f"    {node_id}[{comp_name}]\n"
-
-        for node_id in comp_nodes.values():
-            diagram += f"    style {node_id} fill:#e1f5ff\n"
-
-        diagram += "```\n"
-        return diagram
+        node_lines = []
+        style_lines = []
+        for idx, comp_data in enumerate(report.get("components", {}).values()):
+            node_lines.append(f"    C{idx}[{comp_data['info']['name']}]\n")
+            style_lines.append(f"    style C{idx} fill:#e1f5ff\n")
+
+        return "".join(
+            ("```mermaid\ngraph LR\n", "".join(node_lines), "".join(style_lines), "```\n")
+        )
 
     def _generate_module_hierarchy_diagram(self, module_path: str) -> str:
         """Generate Mermaid diagram for module hierarchy."""
-        diagram = "```mermaid\ngraph TB\n"
+        parts = ["```mermaid\ngraph TB\n"]
 
-        diagram += f'    P["{module_path}"]\n'
+        parts.append(f'    P["{module_path}"]\n')
 
         for idx, child_path in enumerate(self._get_child_modules(module_path)):
             child_id = f"C{idx}"
-            diagram += f'    {child_id}["{child_path}"]\n'
-            diagram += f"    P --> {child_id}\n"
+            parts.append(f'    {child_id}["{child_path}"]\n')
+            parts.append(f"    P --> {child_id}\n")
 
-        diagram += "```\n"
-        return diagram
+        parts.append("```\n")
+        return "".join(parts)
 
     def _generate_repository_architecture_diagram(self) -> str:
         """Generate Mermaid diagram for repository architecture."""
-        diagram = "```mermaid\ngraph TB\n"
+        parts = ["```mermaid\ngraph TB\n"]
 
         if self.analyzer.parsed_tree:
             for idx, module_path in enumerate(self.analyzer.parsed_tree["root_modules"]):
                 mod_id = f"M{idx}"
-                diagram += f'    {mod_id}["{module_path}"]\n'
+                parts.append(f'    {mod_id}["{module_path}"]\n')
 
-        diagram += "```\n"
-        return diagram
+        parts.append("```\n")
+        return "".join(parts)
 
-    def _format_component_section(self, comp_id: str, comp_data: dict[str, Any]) -> str:
-        """Format a component section."""
+    def _format_component_section(self, comp_id: str, comp_data: dict[str, Any]) -> list[str]:
+        """Format a component section as a list of markdown fragments."""
         info = comp_data["info"]
         purpose = comp_data.get("purpose", {})
         deps = comp_data.get("dependencies", {})
 
-        md = f"### {info['name']}\n\n"
-        md += f"**Type**: {info['component_type']}\n"
-        md += f"**File**: `{info['relative_path']}`\n\n"
-        md += f"**Purpose**: {purpose.get('primary_purpose', 'Unknown')}\n\n"
+        parts = [f"### {info['name']}\n\n"]
+        parts.append(f"**Type**: {info['component_type']}\n")
+        parts.append(f"**File**: `{info['relative_path']}`\n\n")
+        parts.append(f"**Purpose**: {purpose.get('primary_purpose', 'Unknown')}\n\n")
 
         internal_deps = deps.get("internal_dependencies", [])
         if internal_deps:
-            md += "**Internal Dependencies**:\n"
+            parts.append("**Internal Dependencies**:\n")
             for dep in internal_deps:
-                md += f"- {dep['name']}\n"
-            md += "\n"
+                parts.append(f"- {dep['name']}\n")
+            parts.append("\n")
 
         external_deps = deps.get("external_dependencies", [])
         if external_deps:
-            md += "**External Dependencies**:\n"
+            parts.append("**External Dependencies**:\n")
             for dep in external_deps:
-                md += f"- {dep['name']} ({dep.get('module', 'unknown')})\n"
-            md += "\n"
+                parts.append(f"- {dep['name']} ({dep.get('module', 'unknown')})\n")
+            parts.append("\n")
 
-        return md
+        return parts
 
     def _get_child_modules(self, module_path: str) -> list[str]:
         """Get direct children of a module."""
-        if not self.analyzer.parsed_tree:
-            return []
-        module_info = self.analyzer.parsed_tree["modules"][module_path]
-        return list(module_info["children"].keys())
+        return self._children_map.get(module_path, [])
 
     def _get_module_doc_path(self, module_path: str) -> Path:
         """Get output path for module documentation."""
@@ -360,21 +444,46 @@ class GatomiaOrchestrator:
         for part in path_parts:
             doc_path = doc_path / part
 
-        doc_path.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(doc_path)
         return doc_path / "README.md"
 
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create a directory (and parents) unless already done this run."""
+        if directory not in self._mkdir_done:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._mkdir_done.add(directory)
+
     def _get_relative_path(self, from_path: Path, to_path: Path) -> str:
         """Get relative path between two paths."""
+        key = (str(from_path.parent), str(to_path))
+        rel = self._relpath_cache.get(key)
+        if rel is None:
+            rel = self._relpath_cache[key] = self._compute_relative_path(from_path.parent, to_path)
+        return rel
+
+    def _compute_relative_path(self, from_dir: Path, to_path: Path) -> str:
+        """Compute a relative path, without filesystem calls when both live under output_dir."""
         try:
-            return os.path.relpath(to_path, from_path.parent)
+            from_parts = from_dir.relative_to(self.output_dir).parts
+            to_parts = to_path.relative_to(self.output_dir).parts
         except ValueError:
-            return str(to_path)
+            try:
+                return os.path.relpath(to_path, from_dir)
+            except ValueError:
+                return str(to_path)
+
+        common = 0
+        for a, b in zip(from_parts, to_parts):
+            if a != b:
+                break
+            common += 1
+        rel_parts = [".."] * (len(from_parts) - common) + list(to_parts[common:])
+        return os.path.join(*rel_parts) if rel_parts else "."
 
     def _save_documentation(self, path: Path, content: str) -> None:
         """Save documentation to file."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        self._ensure_dir(path.parent)
+        path.write_text(content, encoding="utf-8")
 
     def _load_documentation(self, path: Path) -> str:
         """Load documentation from file."""
@@ -382,36 +491,51 @@ class GatomiaOrchestrator:
             return f.read()
 
     def _extract_module_summary(self, doc_path: Path) -> str:
-        """Extract summary from module documentation."""
-        content = self._load_documentation(doc_path)
-        return self._extract_module_summary_from_content(content)
+        """Extract summary from module documentation (cached per path)."""
+        summary = self._summary_cache.get(doc_path)
+        if summary is None:
+            content = self._load_documentation(doc_path)
+            summary = self._summary_cache[doc_path] = self._extract_module_summary_from_content(
+                content
+            )
+        return summary
 
     def _extract_module_summary_from_content(self, content: str) -> str:
-        """Extract summary from documentation content."""
-        lines = content.split("\n")
-        in_overview = False
-        summary_lines = []
+        """Extract summary from documentation content.
+
+        Jumps to the "## Overview" heading and scans forward line by line, so
+        only the few lines that make up the summary are ever sliced out.
+        """
+        marker = "## Overview"
+        if content.startswith(marker):
+            start = 0
+        else:
+            start = content.find("\n" + marker)
+            if start == -1:
+                return "Module documentation."
+            start += 1
 
-        for line in lines:
-            if line.startswith("## Overview"):
-                in_overview = True
+        summary_lines = []
+        end = content.find("\n", start)
+        while end != -1:
+            begin = end + 1
+            end = content.find("\n", begin)
+            line = content[begin:] if end == -1 else content[begin:end]
+            if line.startswith(marker):
                 continue
-
-            if in_overview:
-                if line.startswith("#"):
+            if line.startswith("#"):
+                break
+            line = line.strip()
+            if line:
+                summary_lines.append(line)
+                if len(summary_lines) >= 2:
                     break
-                if line.strip():
-                    summary_lines.append(line.strip())
-                    if len(summary_lines) >= 2:
-                        break
 
         return " ".join(summary_lines) if summary_lines else "Module documentation."
 
 
 def main() -> None:
     """Main entry point."""
-    import sys
-
     if len(sys.argv) < 3:
         print(
             "Usage: python orchestrator.py <module_tree.json> <dependency_graph.json> [output_dir]"
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for the GatomIA Diagram Generator.
+Run from this directory with: python -m unittest test_diagram_generator
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from diagram_generator import DiagramGenerator
+
+
+class ModuleLookupTest(unittest.TestCase):
+    """Module lookup by path over the module tree."""
+
+    def _generator(self, module_tree: dict) -> DiagramGenerator:
+        """Build a generator over a module tree written to a temporary file."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        tree_path = Path(tmp_dir.name) / "module_tree.json"
+        tree_path.write_text(json.dumps(module_tree), encoding="utf-8")
+        return DiagramGenerator(str(tree_path))
+
+    def test_nested_module_is_found(self) -> None:
+        generator = self._generator(
+            {"src": {"components": [], "children": {"src/core": {"components": ["core.A"]}}}}
+        )
+        self.assertEqual(generator._find_module("src/core"), {"components": ["core.A"]})
+        self.assertIsNone(generator._find_module("src/missing"))
+
+    def test_duplicate_path_resolves_to_first_in_pre_order(self) -> None:
+        # "shared" appears nested under "a" before it appears at the top level;
+        # a pre-order search reaches the nested one first
+        generator = self._generator(
+            {
+                "a": {"components": [], "children": {"shared": {"components": ["nested.X"]}}},
+                "shared": {"components": ["top.Y"]},
+            }
+        )
+        self.assertEqual(generator._find_module("shared"), {"components": ["nested.X"]})
+        diagram = generator.generate_architecture_diagram("shared")
+        self.assertIn('C0["X"]', diagram)
+        self.assertNotIn('"Y"', diagram)
+
+
+if __name__ == "__main__":
+    unittest.main()
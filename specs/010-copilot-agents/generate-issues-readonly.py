@@ -13,69 +13,80 @@ import re
 FEATURE_NUMBER = "010"
 FEATURE_NAME = "copilot-agents"
 
-def parse_tasks_from_file(filepath: str):
-    """Parse tasks.md and extract all tasks"""
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    tasks = []
+# Patterns used for every line of tasks.md, compiled once
+_PHASE_HDR = re.compile(r'Phase\s+(\d+)[:\s]+(.+?)(?:\s+\(|$)')
+_TASK_LINE = re.compile(r'^-\s+\[\s*\]\s+(T\d+)\s+(.+)$')
+_US = re.compile(r'\[US(\d+)\]')
+_PHASE_NUM = re.compile(r'Phase\s+(\d+)')
+_MARKER_STRIP = re.compile(r'\[P\]|\[US\d+\]')
+
+_PHASE_LABELS = {1: "phase:setup", 2: "phase:foundational"}
+
+# Checked in order against the phase heading; the first match wins
+_PRIORITY_TOKENS = (
+    ("Priority: P1", "priority:p1"),
+    ("🎯 MVP", "priority:p1"),
+    ("Priority: P2", "priority:p2"),
+    ("Priority: P3", "priority:p3"),
+)
+
+
+def _phase_label(n):
+    """Map a phase number to its label"""
+    return _PHASE_LABELS.get(n, "phase:implementation" if n <= 8 else "phase:polish")
+
+
+def iter_tasks(filepath: str):
+    """Parse tasks.md line by line and yield each task as it is found"""
     current_phase = "Unknown"
     
-    lines = content.split('\n')
-    for i, line in enumerate(lines):
-        # Track current phase
-        if line.startswith('## Phase'):
-            phase_match = re.search(r'Phase\s+(\d+)[:\s]+(.+?)(?:\s+\(|$)', line)
-            if phase_match:
-                current_phase = f"Phase {phase_match.group(1)}: {phase_match.group(2)}"
-        
-        # Find task lines
-        task_match = re.match(r'^-\s+\[\s*\]\s+(T\d+)\s+(.+)$', line)
-        if task_match:
-            task_id = task_match.group(1)
-            task_desc = task_match.group(2)
-            
-            # Determine labels
-            labels = [f"feature:{FEATURE_NUMBER}"]
-            
-            # Phase label
-            phase_num = re.search(r'Phase\s+(\d+)', current_phase)
-            if phase_num:
-                pn = int(phase_num.group(1))
-                if pn == 1:
-                    labels.append("phase:setup")
-                elif pn == 2:
-                    labels.append("phase:foundational")
-                elif pn <= 8:
-                    labels.append("phase:implementation")
-                else:
-                    labels.append("phase:polish")
-            
-            # Check for markers
-            if '[P]' in task_desc:
-                labels.append("parallel")
-            
-            # User story
-            us_match = re.search(r'\[US(\d+)\]', task_desc)
-            if us_match:
-                labels.append(f"user-story:{us_match.group(1)}")
-            
-            # Priority
-            if 'Priority: P1' in current_phase or '🎯 MVP' in current_phase:
-                labels.append("priority:p1")
-            elif 'Priority: P2' in current_phase:
-                labels.append("priority:p2")
-            elif 'Priority: P3' in current_phase:
-                labels.append("priority:p3")
-            elif 'CRITICAL' in current_phase or 'CRITICAL' in task_desc:
-                labels.append("priority:critical")
-            
-            # Clean title
-            title = re.sub(r'\[P\]|\[US\d+\]', '', task_desc).strip()
-            title = f"[{task_id}] {title}"
+    with open(filepath, 'r') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            # Track current phase
+            if line.startswith('## Phase'):
+                phase_match = _PHASE_HDR.search(line)
+                if phase_match:
+                    current_phase = f"Phase {phase_match.group(1)}: {phase_match.group(2)}"
             
-            # Build body
-            body = f"""**Phase**: {current_phase}
+            # Find task lines (cheap prefix check before entering the regex engine)
+            task_match = _TASK_LINE.match(line) if line.startswith('-') else None
+            if task_match:
+                task_id = task_match.group(1)
+                task_desc = task_match.group(2)
+                
+                # Determine labels
+                labels = [f"feature:{FEATURE_NUMBER}"]
+                
+                # Phase label
+                phase_num = _PHASE_NUM.search(current_phase)
+                if phase_num:
+                    labels.append(_phase_label(int(phase_num.group(1))))
+                
+                # Check for markers
+                if '[P]' in task_desc:
+                    labels.append("parallel")
+                
+                # User story
+                us_match = _US.search(task_desc)
+                if us_match:
+                    labels.append(f"user-story:{us_match.group(1)}")
+                
+                # Priority
+                priority = next(
+                    (lbl for tok, lbl in _PRIORITY_TOKENS if tok in current_phase), None
+                )
+                if priority is None and 'CRITICAL' in f"{current_phase}\n{task_desc}":
+                    priority = "priority:critical"
+                if priority:
+                    labels.append(priority)
+                
+                # Clean title
+                title = _MARKER_STRIP.sub('', task_desc).strip()
+                title = f"[{task_id}] {title}"
+                
+                # Build body
+                body = f"""**Phase**: {current_phase}
 **Task**: {task_id}
 **Feature**: {FEATURE_NUMBER}-{FEATURE_NAME}
 
@@ -85,69 +96,128 @@ def parse_tasks_from_file(filepath: str):
 ## Reference
 From specs/{FEATURE_NUMBER}-{FEATURE_NAME}/tasks.md
 """
-            
-            tasks.append({
-                'title': title[:80],  # GitHub limits
-                'body': body.replace('\n', '\\n'),  # CSV escape
-                'labels': ','.join(labels),
-                'task_id': task_id,
-                'phase': current_phase,
-                'description': task_desc
-            })
+                
+                yield {
+                    'title': title[:80],  # GitHub limits
+                    'body': body,  # csv quotes embedded newlines itself
+                    'labels': ','.join(labels),
+                    'task_id': task_id,
+                    'phase': current_phase,
+                    'description': task_desc
+                }
+
+
+def parse_tasks_from_file(filepath: str):
+    """Parse tasks.md and extract all tasks"""
+    return list(iter_tasks(filepath))
+
+
+CSV_FIELDS = ['title', 'body', 'labels']
+
+
+def _csv_row(task):
+    """CSV row for one task, in CSV_FIELDS order"""
+    return [task['title'], task['body'], task['labels']]
+
+
+def _write_markdown_header(f):
+    """Write the permissions notes and open the commands code block"""
+    f.write(f"# GitHub Issues for Feature {FEATURE_NUMBER}\n\n")
+    f.write("**IMPORTANT**: You need WRITE permissions to create these issues.\n\n")
+    f.write("## Contact Repository Admin\n\n")
+    f.write("Ask the `eitatech` organization admin to grant you **Write** or **Maintain** permissions.\n\n")
+    f.write("Check who has admin access: Go to https://github.com/eitatech/gatomia-vscode/settings/access\n\n")
+    f.write("---\n\n")
+    f.write("## Manual Creation Commands\n\n")
+    f.write("Once you have permissions, run these commands:\n\n")
+    f.write("```bash\n")
+
+
+def _write_markdown_command(f, task):
+    """Write the gh issue create command for one task"""
+    # Escape quotes and newlines for shell
+    title = task['title'].replace('"', '\\"')
+    body = task['description'].replace('"', '\\"').replace('\n', '\\n')
     
-    return tasks
+    f.write(f'\n# {task["task_id"]}\n')
+    f.write(f'gh issue create -R eitatech/gatomia-vscode \\\n')
+    f.write(f'  --title "{title}" \\\n')
+    f.write(f'  --body "{body}" \\\n')
+    f.write(f'  --label "{task["labels"]}"\n')
+
+
+def _markdown_summary_entry(task):
+    """Checklist entry for one task in the Issues Summary section"""
+    return (
+        f"- [ ] **{task['task_id']}**: {task['description'][:100]}...\n"
+        f"      - Phase: {task['phase']}\n"
+        f"      - Labels: {task['labels']}\n\n"
+    )
+
+
+def _write_markdown_footer(f, summary_entries):
+    """Close the commands code block and write the Issues Summary section"""
+    f.write("```\n\n")
+    f.write("---\n\n")
+    f.write("## Issues Summary\n\n")
+    f.writelines(summary_entries)
+
+
+def _report_csv(output_file):
+    """Tell the user where the CSV file was written"""
+    print(f"✅ Created CSV file: {output_file}")
+    print(f"   You can import this via GitHub web UI")
+
+
+def _report_markdown(output_file):
+    """Tell the user where the markdown file was written"""
+    print(f"✅ Created markdown file: {output_file}")
+    print(f"   This contains all commands to run once you have permissions")
 
 
 def generate_csv(tasks, output_file):
     """Generate CSV for GitHub bulk import"""
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['title', 'body', 'labels'])
-        writer.writeheader()
-        for task in tasks:
-            writer.writerow({
-                'title': task['title'],
-                'body': task['body'],
-                'labels': task['labels']
-            })
-    print(f"✅ Created CSV file: {output_file}")
-    print(f"   You can import this via GitHub web UI")
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(CSV_FIELDS)
+        writer.writerows(map(_csv_row, tasks))
+    _report_csv(output_file)
 
 
 def generate_markdown_checklist(tasks, output_file):
     """Generate markdown file with gh commands"""
+    # Commands and the summary each need a pass; an iterator would leave the summary empty
+    tasks = list(tasks)
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(f"# GitHub Issues for Feature {FEATURE_NUMBER}\n\n")
-        f.write("**IMPORTANT**: You need WRITE permissions to create these issues.\n\n")
-        f.write("## Contact Repository Admin\n\n")
-        f.write("Ask the `eitatech` organization admin to grant you **Write** or **Maintain** permissions.\n\n")
-        f.write("Check who has admin access: Go to https://github.com/eitatech/gatomia-vscode/settings/access\n\n")
-        f.write("---\n\n")
-        f.write("## Manual Creation Commands\n\n")
-        f.write("Once you have permissions, run these commands:\n\n")
-        f.write("```bash\n")
-        
+        _write_markdown_header(f)
         for task in tasks:
-            # Escape quotes and newlines for shell
-            title = task['title'].replace('"', '\\"')
-            body = task['description'].replace('"', '\\"').replace('\n', '\\n')
-            
-            f.write(f'\n# {task["task_id"]}\n')
-            f.write(f'gh issue create -R eitatech/gatomia-vscode \\\n')
-            f.write(f'  --title "{title}" \\\n')
-            f.write(f'  --body "{body}" \\\n')
-            f.write(f'  --label "{task["labels"]}"\n')
-        
-        f.write("```\n\n")
-        f.write("---\n\n")
-        f.write("## Issues Summary\n\n")
+            _write_markdown_command(f, task)
+        _write_markdown_footer(f, map(_markdown_summary_entry, tasks))
+    _report_markdown(output_file)
+
+
+def write_outputs(tasks, csv_file, md_file):
+    """Write the CSV and markdown files in one pass over tasks; returns the task count
+
+    Only the short summary entries are held until the end, since that section
+    follows all of the commands in the markdown file.
+    """
+    count = 0
+    summary_entries = []
+    with open(csv_file, 'w', newline='', encoding='utf-8') as csv_f, \
+            open(md_file, 'w', encoding='utf-8') as md_f:
+        writer = csv.writer(csv_f, quoting=csv.QUOTE_ALL)
+        writer.writerow(CSV_FIELDS)
+        _write_markdown_header(md_f)
         
         for task in tasks:
-            f.write(f"- [ ] **{task['task_id']}**: {task['description'][:100]}...\n")
-            f.write(f"      - Phase: {task['phase']}\n")
-            f.write(f"      - Labels: {task['labels']}\n\n")
-    
-    print(f"✅ Created markdown file: {output_file}")
-    print(f"   This contains all commands to run once you have permissions")
+            writer.writerow(_csv_row(task))
+            _write_markdown_command(md_f, task)
+            summary_entries.append(_markdown_summary_entry(task))
+            count += 1
+        
+        _write_markdown_footer(md_f, summary_entries)
+    return count
 
 
 def main():
@@ -158,21 +228,21 @@ def main():
     tasks_file = f"specs/{FEATURE_NUMBER}-{FEATURE_NAME}/tasks.md"
     print(f"Parsing tasks from {tasks_file}...")
     
-    tasks = parse_tasks_from_file(tasks_file)
-    print(f"✓ Found {len(tasks)} tasks\n")
-    
-    # Generate CSV for web import
     csv_file = f"specs/{FEATURE_NUMBER}-{FEATURE_NAME}/issues-import.csv"
-    generate_csv(tasks, csv_file)
-    
-    # Generate markdown with commands
     md_file = f"specs/{FEATURE_NUMBER}-{FEATURE_NAME}/issues-commands.md"
-    generate_markdown_checklist(tasks, md_file)
+    
+    # Parse and write both files in a single streaming pass
+    total = write_outputs(iter_tasks(tasks_file), csv_file, md_file)
+    print(f"✓ Found {total} tasks\n")
+    
+    # CSV for web import, markdown with commands
+    _report_csv(csv_file)
+    _report_markdown(md_file)
     
     print("\n" + "=" * 80)
     print("Summary")
     print("=" * 80)
-    print(f"Total tasks: {len(tasks)}")
+    print(f"Total tasks: {total}")
     print(f"\nNext steps:")
     print(f"1. Request Write permissions from eitatech organization admin")
     print(f"2. Option A: Use {csv_file} for bulk import via GitHub web UI")
@@ -1,22 +1,83 @@
 #!/usr/bin/env python3
 """
 Generate GitHub issues from tasks.md using gh CLI
+(gh supplies the auth token; labels and issues go straight to the GitHub API)
 This script:
 1. Creates generic, reusable labels
 2. Parses tasks.md to extract all tasks
 3. Creates GitHub issues with proper metadata
 """
 
+import argparse
+import http.client
+import json
 import re
 import subprocess
 import sys
-from typing import Dict, List, Tuple
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator
+    orjson = None
 
 # Configuration
 REPO = "eitatech/gatomia-vscode"
+REPO_OWNER, REPO_NAME = REPO.split("/")
+API_HOST = "api.github.com"
 FEATURE_NUMBER = "010"
 FEATURE_NAME = "copilot-agents"
 
+# createIssue mutations sent per GraphQL request (keeps each request well under node limits)
+ISSUE_BATCH_SIZE = 50
+
+# tasks.md patterns, compiled once
+_PHASE_SPLIT_RE = re.compile(r'##\s+Phase\s+\d+:')
+_TASK_RE = re.compile(r'^-\s+\[\s*\]\s+(T\d+)(.*?)$', re.MULTILINE)
+_MARKER_STRIP_RE = re.compile(r'\[P\]\s*|\[US\d+\]\s*')
+
+# Section priority markers; earlier entries in _PRIORITY_RANK take precedence
+_PRIORITY_RE = re.compile(r'Priority: P[123]|🎯 MVP|CRITICAL')
+_PRIORITY_BY_MARKER = {
+    "Priority: P1": "p1",
+    "🎯 MVP": "p1",
+    "Priority: P2": "p2",
+    "Priority: P3": "p3",
+    "CRITICAL": "critical",
+}
+_PRIORITY_RANK = {"p1": 0, "p2": 1, "p3": 2, "critical": 3}
+
+# Issue titles keep this many characters of the cleaned description
+TITLE_LENGTH = 100
+# Characters of the description scanned before falling back to the whole line
+_TITLE_SCAN = 150
+
+# (label, name) per phase, indexed by the phase's position in tasks.md
+PHASE_LABELS = [
+    None,
+    ("phase:setup", "Phase 1"),
+    ("phase:foundational", "Phase 2"),
+    ("phase:implementation", "Phase 3"),
+    ("phase:implementation", "Phase 4"),
+    ("phase:implementation", "Phase 5"),
+    ("phase:implementation", "Phase 6"),
+    ("phase:implementation", "Phase 7"),
+    ("phase:implementation", "Phase 8"),
+    ("phase:polish", "Phase 9"),
+]
+UNKNOWN_PHASE = ("phase:implementation", "Unknown Phase")
+
+# Constant pieces of every issue body, resolved once
+_BODY_FEATURE = f"\n**Feature**: {FEATURE_NUMBER}-{FEATURE_NAME}"
+_BODY_TAIL = (
+    f" from specs/{FEATURE_NUMBER}-{FEATURE_NAME}/tasks.md\n"
+    "\n"
+    "---\n"
+    "*This issue was auto-generated from tasks.md*\n"
+)
+
 # Label colors (GitHub format: RRGGBB)
 COLORS = {
     "feature": "0366d6",      # Blue
@@ -66,203 +127,416 @@ LABELS = [
 ]
 
 
-def create_label(name: str, color: str, description: str) -> bool:
-    """Create a GitHub label if it doesn't exist"""
-    # Check if label exists
-    result = subprocess.run(
-        ["gh", "label", "list", "-R", REPO],
-        capture_output=True,
-        text=True
+def _clean_title(task_desc: str) -> str:
+    """Strip [P]/[US<n>] markers and trim to TITLE_LENGTH, scanning only a bounded prefix
+    
+    The prefix is cut at its last '[': no marker match can span that point,
+    so the cleaned head equals the start of the fully cleaned text.
+    """
+    if len(task_desc) > _TITLE_SCAN:
+        cut = task_desc.rfind('[', 0, _TITLE_SCAN)
+        head = _MARKER_STRIP_RE.sub('', task_desc[:_TITLE_SCAN if cut == -1 else cut]).lstrip()
+        # Enough text is known once there is non-blank content past the title length
+        if head[TITLE_LENGTH:].strip():
+            return head[:TITLE_LENGTH]
+    return _MARKER_STRIP_RE.sub('', task_desc).strip()[:TITLE_LENGTH]
+
+
+def _find_user_story(task_line: str):
+    """Return the number from the first [US<digits>] marker, or None (str.find, no regex)"""
+    start = task_line.find('[US')
+    while start != -1:
+        digits_start = end = start + 3
+        while end < len(task_line) and task_line[end].isdecimal():
+            end += 1
+        if end > digits_start and task_line.startswith(']', end):
+            return task_line[digits_start:end]
+        start = task_line.find('[US', start + 1)
+    return None
+
+
+class TaskMeta(NamedTuple):
+    """Markers found on a task line and its section"""
+    parallel: bool
+    user_story: Optional[str]
+    priority: Optional[str]
+
+
+class Task(NamedTuple):
+    """A parsed task, ready to become an issue"""
+    id: str
+    title: str
+    description: str
+    phase: str
+    labels: str
+    metadata: TaskMeta
+
+
+def _detect_priority(section_content: str) -> Optional[str]:
+    """Determine a phase section's priority ("p1", "p2", "p3", "critical" or None)
+    
+    One regex pass finds every marker. The best-ranked one wins wherever it
+    appears, and the scan stops as soon as p1 is seen.
+    """
+    best = None
+    for match in _PRIORITY_RE.finditer(section_content):
+        priority = _PRIORITY_BY_MARKER[match.group()]
+        if priority == "p1":
+            return priority
+        if best is None or _PRIORITY_RANK[priority] < _PRIORITY_RANK[best]:
+            best = priority
+    return best
+
+
+def extract_task_metadata(task_line: str, section_priority: Optional[str]) -> TaskMeta:
+    """Extract metadata from task line; the priority comes from its section"""
+    return TaskMeta("[P]" in task_line, _find_user_story(task_line), section_priority)
+
+
+@lru_cache(maxsize=128)
+def _labels_for(
+    phase_label: str, parallel: bool, priority: Optional[str], user_story: Optional[str]
+) -> str:
+    """Comma-separated labels for one combination of markers (many tasks share one)"""
+    parts = (
+        f"feature:{FEATURE_NUMBER}",
+        phase_label,
+        "parallel" if parallel else None,
+        f"priority:{priority}" if priority else None,
+        f"user-story:{user_story}" if user_story else None,
     )
+    return ",".join(part for part in parts if part)
+
+
+def build_labels_list(phase_label: str, metadata: TaskMeta) -> str:
+    """Build comma-separated labels list"""
+    return _labels_for(phase_label, metadata.parallel, metadata.priority, metadata.user_story)
+
+
+_api_token = None
+_api_connection = None
+
+
+def _github_token() -> str:
+    """Read the gh auth token once per run"""
+    global _api_token
+    if _api_token is None:
+        try:
+            _api_token = subprocess.check_output(
+                ["gh", "auth", "token"], text=True, stderr=subprocess.PIPE
+            ).strip()
+        except FileNotFoundError:
+            print("✗ Error: could not read a GitHub token: gh is not installed")
+            sys.exit(1)
+        except subprocess.CalledProcessError as e:
+            print(f"✗ Error: could not read a GitHub token: {e.stderr.strip() or e}")
+            print("  Run 'gh auth login' first")
+            sys.exit(1)
+    return _api_token
+
+
+def _wait_for_rate_limit(response: http.client.HTTPResponse) -> None:
+    """Sleep until the rate-limit window resets when the last request used it up"""
+    if response.getheader("X-RateLimit-Remaining") == "0":
+        reset_at = int(response.getheader("X-RateLimit-Reset", "0"))
+        delay = max(0, reset_at - int(time.time())) + 1
+        print(f"  Rate limit reached, waiting {delay}s...")
+        time.sleep(delay)
+
+
+def _api_request(method: str, path: str, payload: Dict) -> Tuple[int, Dict]:
+    """Send one JSON request over a single kept-alive HTTPS connection (uses orjson when available)
+    
+    Returns the status code and the decoded response body.
+    """
+    global _api_connection
+    if _api_connection is None:
+        _api_connection = http.client.HTTPSConnection(API_HOST, timeout=60)
+    
+    headers = {
+        "Authorization": f"Bearer {_github_token()}",
+        "Accept": "application/vnd.github+json",
+        "Content-Type": "application/json",
+        "User-Agent": f"{FEATURE_NUMBER}-{FEATURE_NAME}-issue-generator",
+    }
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
     
-    if name in result.stdout:
-        print(f"✓ Label already exists: {name}")
-        return True
+    try:
+        _api_connection.request(method, path, body=body, headers=headers)
+        response = _api_connection.getresponse()
+        data = response.read()
+    except (http.client.HTTPException, OSError) as e:
+        # Drop the connection so the next request reconnects; never resend a mutation
+        _api_connection.close()
+        _api_connection = None
+        raise RuntimeError(f"GitHub API request failed: {e}") from e
+    
+    _wait_for_rate_limit(response)
     
-    # Create label
     try:
-        subprocess.run(
-            ["gh", "label", "create", name, "--color", color, "--description", description, "-R", REPO],
-            check=True,
-            capture_output=True
+        return response.status, orjson.loads(data) if orjson is not None else json.loads(data)
+    except ValueError:
+        # Error pages from proxies and load balancers are not JSON
+        return response.status, {"message": data.decode("utf-8", errors="replace")}
+
+
+def github_graphql(query: str, variables: Dict) -> Dict:
+    """POST a GraphQL request and return the decoded response"""
+    status, data = _api_request("POST", "/graphql", {"query": query, "variables": variables})
+    
+    # GraphQL errors arrive with 200 and a partial response; anything else is fatal
+    if status != 200:
+        raise RuntimeError(f"GitHub API returned {status}: {data.get('message', data)}")
+    return data
+
+
+def fetch_repository_ids() -> Tuple[str, Dict[str, str]]:
+    """Fetch the repository node ID and a label name -> node ID map"""
+    query = """query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100, after: $cursor) {
+      nodes { id name }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}"""
+    variables = {"owner": REPO_OWNER, "name": REPO_NAME, "cursor": None}
+    label_ids = {}
+    
+    while True:
+        try:
+            response = github_graphql(query, variables)
+        except RuntimeError as e:
+            print(f"✗ Error: could not read repository {REPO}: {e}")
+            sys.exit(1)
+        
+        repository = (response.get("data") or {}).get("repository")
+        if repository is None or response.get("errors"):
+            errors = response.get("errors", [])
+            detail = "; ".join(error.get("message", "unknown error") for error in errors)
+            print(f"✗ Error: could not read repository {REPO}: {detail or 'not found'}")
+            sys.exit(1)
+        
+        labels = repository["labels"]
+        for node in labels["nodes"]:
+            label_ids[node["name"]] = node["id"]
+        if not labels["pageInfo"]["hasNextPage"]:
+            return repository["id"], label_ids
+        variables["cursor"] = labels["pageInfo"]["endCursor"]
+
+
+def _alias_errors(response: Dict) -> Dict[Optional[str], str]:
+    """Map each mutation alias to its first error message (None for request-wide errors)"""
+    errors = {}
+    for error in response.get("errors", []):
+        alias = (error.get("path") or [None])[0]
+        errors.setdefault(alias, error.get("message", "unknown error"))
+    return errors
+
+
+def create_label(name: str, color: str, description: str, label_ids: Dict[str, str]) -> str:
+    """Create one label through the REST API and record its node ID
+    
+    Returns the status line to print.
+    """
+    try:
+        status, data = _api_request(
+            "POST",
+            f"/repos/{REPO}/labels",
+            {"name": name, "color": color, "description": description},
         )
-        print(f"✓ Created label: {name}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to create label {name}: {e.stderr.decode()}")
-        return False
+    except RuntimeError as e:
+        return f"✗ Failed to create label {name}: {e}"
+    
+    if status != 201:
+        # 422 responses name the failed check, e.g. already_exists or invalid
+        errors = [error for error in data.get("errors", []) if isinstance(error, dict)]
+        codes = ", ".join(error["code"] for error in errors if error.get("code"))
+        detail = data.get("message", "unknown error") + (f" ({codes})" if codes else "")
+        return f"✗ Failed to create label {name}: {detail}"
+    
+    label_ids[name] = data["node_id"]
+    return f"✓ Created label: {name}"
 
 
-def create_labels():
-    """Create all labels"""
+def create_labels() -> Tuple[str, Dict[str, str]]:
+    """Create all missing labels, reusing the API connection opened by the label lookup
+    
+    Returns the repository node ID and the label name -> node ID map,
+    including the labels created here.
+    """
     print("=" * 80)
     print(f"Creating GitHub labels for feature {FEATURE_NUMBER}...")
     print("=" * 80)
     
-    success_count = 0
+    repository_id, label_ids = fetch_repository_ids()
+    
     for name, color, description in LABELS:
-        if create_label(name, color, description):
-            success_count += 1
+        if name in label_ids:
+            print(f"✓ Label already exists: {name}")
+        else:
+            print(create_label(name, color, description, label_ids))
     
+    success_count = sum(1 for name, _, _ in LABELS if name in label_ids)
     print(f"\n✅ Successfully created/verified {success_count}/{len(LABELS)} labels\n")
+    return repository_id, label_ids
 
 
-def parse_phase_info(content: str) -> Dict[str, str]:
-    """Extract phase information from content"""
-    phase_map = {
-        "Phase 1": "phase:setup",
-        "Phase 2": "phase:foundational",
-        "Phase 3": "phase:implementation",
-        "Phase 4": "phase:implementation",
-        "Phase 5": "phase:implementation",
-        "Phase 6": "phase:implementation",
-        "Phase 7": "phase:implementation",
-        "Phase 8": "phase:implementation",
-        "Phase 9": "phase:polish",
-    }
-    
-    for phase_name, label in phase_map.items():
-        if phase_name in content:
-            return {"label": label, "name": phase_name}
-    
-    return {"label": "phase:implementation", "name": "Unknown Phase"}
-
-
-def extract_task_metadata(task_line: str, section_content: str) -> Dict:
-    """Extract metadata from task line"""
-    metadata = {
-        "parallel": "[P]" in task_line,
-        "user_story": None,
-        "priority": None,
-    }
-    
-    # Extract user story
-    us_match = re.search(r'\[US(\d+)\]', task_line)
-    if us_match:
-        metadata["user_story"] = us_match.group(1)
+def create_issues_batch(tasks: List[Task], repository_id: str, label_ids: Dict[str, str]) -> int:
+    """Create GitHub issues with aliased createIssue mutations, ISSUE_BATCH_SIZE per request
     
-    # Determine priority from section
-    if "Priority: P1" in section_content or "🎯 MVP" in section_content:
-        metadata["priority"] = "p1"
-    elif "Priority: P2" in section_content:
-        metadata["priority"] = "p2"
-    elif "Priority: P3" in section_content:
-        metadata["priority"] = "p3"
-    elif "CRITICAL" in section_content:
-        metadata["priority"] = "critical"
+    Tasks with a label that has no node ID are reported as failed rather
+    than created without it. Returns the number of issues created.
+    """
+    success_count = 0
     
-    return metadata
+    resolved = []
+    for task in tasks:
+        unresolved = [label for label in task.labels.split(",") if label not in label_ids]
+        if unresolved:
+            print(f"✗ Failed to create: {task.title}")
+            print(f"  Error: labels not found in {REPO}: {', '.join(unresolved)}")
+        else:
+            resolved.append(task)
+    tasks = resolved
+    
+    for start in range(0, len(tasks), ISSUE_BATCH_SIZE):
+        chunk = tasks[start:start + ISSUE_BATCH_SIZE]
+        
+        declarations = ["$repositoryId: ID!"]
+        mutations = []
+        variables = {"repositoryId": repository_id}
+        for i, task in enumerate(chunk):
+            print(f"Creating: {task.title}")
+            declarations.append(f"$t{i}: String!, $b{i}: String, $l{i}: [ID!]")
+            mutations.append(
+                f"m{i}: createIssue(input: {{repositoryId: $repositoryId, "
+                f"title: $t{i}, body: $b{i}, labelIds: $l{i}}}) {{ issue {{ number }} }}"
+            )
+            variables[f"t{i}"] = task.title
+            variables[f"b{i}"] = generate_issue_body(task)
+            variables[f"l{i}"] = [label_ids[label] for label in task.labels.split(",")]
+        
+        query = f"mutation({', '.join(declarations)}) {{\n  " + "\n  ".join(mutations) + "\n}"
+        
+        try:
+            response = github_graphql(query, variables)
+        except RuntimeError as e:
+            response = {"errors": [{"message": str(e)}]}
+        
+        data = response.get("data") or {}
+        errors = _alias_errors(response)
+        
+        for i, task in enumerate(chunk):
+            if data.get(f"m{i}"):
+                success_count += 1
+            else:
+                print(f"✗ Failed to create: {task.title}")
+                print(f"  Error: {errors.get(f'm{i}') or errors.get(None, 'unknown error')}")
+    
+    return success_count
 
 
-def build_labels_list(phase_label: str, metadata: Dict) -> str:
-    """Build comma-separated labels list"""
-    labels = [f"feature:{FEATURE_NUMBER}", phase_label]
-    
-    if metadata["parallel"]:
-        labels.append("parallel")
-    
-    if metadata["priority"]:
-        labels.append(f"priority:{metadata['priority']}")
-    
-    if metadata["user_story"]:
-        labels.append(f"user-story:{metadata['user_story']}")
-    
-    return ",".join(labels)
+def _iter_phase_sections(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the text of each phase section from a stream of lines
+    
+    Only the current section is held in memory. Text before the first phase
+    header is skipped, the same as the first piece of a split on the header.
+    """
+    section = None
+    for line in lines:
+        if 'Phase' in line:
+            pieces = _PHASE_SPLIT_RE.split(line)
+            if len(pieces) > 1:
+                if section is not None:
+                    section.append(pieces[0])
+                    yield "".join(section)
+                # Several headers on one line delimit (short) sections of their own
+                yield from pieces[1:-1]
+                section = [pieces[-1]]
+                continue
+        if section is not None:
+            section.append(line)
+    
+    if section is not None:
+        yield "".join(section)
 
 
-def create_issue(title: str, body: str, labels: str) -> bool:
-    """Create a GitHub issue"""
-    print(f"Creating: {title}")
-    
-    try:
-        subprocess.run(
-            ["gh", "issue", "create", "-R", REPO, "--title", title, "--body", body, "--label", labels],
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to create: {title}")
-        print(f"  Error: {e.stderr}")
-        return False
+def _parse_section(section: str, i: int) -> Iterator[Task]:
+    """Yield the tasks of the i-th phase section"""
+    phase_label, phase_name = PHASE_LABELS[i] if i < len(PHASE_LABELS) else UNKNOWN_PHASE
+    section_priority = _detect_priority(section)
+    
+    # Find all task lines
+    for match in _TASK_RE.finditer(section):
+        task_id = match.group(1)
+        task_desc = match.group(2).strip()
+        
+        # Extract metadata
+        metadata = extract_task_metadata(task_desc, section_priority)
+        
+        # Build title (remove markers like [P], [US1] from title)
+        title = f"[{task_id}] {_clean_title(task_desc)}"
+        
+        # Build labels
+        labels = build_labels_list(phase_label, metadata)
+        
+        yield Task(task_id, title, task_desc, phase_name, labels, metadata)
 
 
-def parse_tasks_from_file(filepath: str) -> List[Dict]:
+def parse_tasks_from_file(filepath: str) -> List[Task]:
     """Parse tasks.md and extract all tasks with metadata"""
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
     tasks = []
     
-    # Split by phase sections
-    phase_sections = re.split(r'##\s+Phase\s+\d+:', content)
-    
-    for i, section in enumerate(phase_sections[1:], 1):  # Skip first empty section
-        phase_info = parse_phase_info(f"Phase {i}")
-        
-        # Find all task lines
-        task_pattern = r'^-\s+\[\s*\]\s+(T\d+)(.*?)$'
-        for match in re.finditer(task_pattern, section, re.MULTILINE):
-            task_id = match.group(1)
-            task_desc = match.group(2).strip()
-            
-            # Extract metadata
-            metadata = extract_task_metadata(task_desc, section)
-            
-            # Build title (remove markers like [P], [US1] from title)
-            title = re.sub(r'\[P\]\s*|\[US\d+\]\s*', '', task_desc).strip()
-            title = f"[{task_id}] {title[:100]}"  # Limit title length
-            
-            # Build labels
-            labels = build_labels_list(phase_info["label"], metadata)
-            
-            tasks.append({
-                "id": task_id,
-                "title": title,
-                "description": task_desc,
-                "phase": phase_info["name"],
-                "labels": labels,
-                "metadata": metadata,
-            })
+    with open(filepath, 'r') as f:
+        for i, section in enumerate(_iter_phase_sections(f), 1):
+            tasks.extend(_parse_section(section, i))
     
     return tasks
 
 
-def generate_issue_body(task: Dict) -> str:
+def generate_issue_body(task: Task) -> str:
     """Generate issue body from task info"""
-    body = f"""**Phase**: {task['phase']}
-**Feature**: {FEATURE_NUMBER}-{FEATURE_NAME}"""
+    parts = ["**Phase**: ", task.phase, _BODY_FEATURE]
     
-    if task['metadata']['user_story']:
-        body += f"\n**User Story**: US{task['metadata']['user_story']}"
+    if task.metadata.user_story:
+        parts.append(f"\n**User Story**: US{task.metadata.user_story}")
     
-    if task['metadata']['parallel']:
-        body += "\n**Can Run in Parallel**: Yes [P]"
+    if task.metadata.parallel:
+        parts.append("\n**Can Run in Parallel**: Yes [P]")
     
-    body += f"""
-
-## Description
-{task['description']}
+    parts += ("\n\n## Description\n", task.description, "\n\n## Task\n", task.id, _BODY_TAIL)
+    
+    return "".join(parts)
 
-## Task
-{task['id']} from specs/{FEATURE_NUMBER}-{FEATURE_NAME}/tasks.md
 
----
-*This issue was auto-generated from tasks.md*
-"""
-    
-    return body
+def print_planned_issues(tasks: List[Task]) -> None:
+    """Print the title and labels of each issue a real run would create"""
+    for task in tasks:
+        print(f"Would create: {task.title}")
+        print(f"  Labels: {task.labels}")
 
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(
+        description=f"Generate GitHub issues for feature {FEATURE_NUMBER}"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="parse tasks.md and print the planned issues without calling gh or the GitHub API"
+    )
+    args = parser.parse_args()
+    
     print("\n" + "=" * 80)
     print(f"GitHub Issue Generator for Feature {FEATURE_NUMBER}")
     print("=" * 80 + "\n")
     
     # Step 1: Create labels
-    create_labels()
+    if not args.dry_run:
+        repository_id, label_ids = create_labels()
     
     # Step 2: Parse tasks
     tasks_file = f"specs/{FEATURE_NUMBER}-{FEATURE_NAME}/tasks.md"
@@ -276,16 +550,20 @@ def main():
         print("  Make sure you're running from the repository root")
         sys.exit(1)
     
+    if args.dry_run:
+        print("=" * 80)
+        print("Planned GitHub issues (dry run, nothing is created)...")
+        print("=" * 80 + "\n")
+        print_planned_issues(tasks)
+        print(f"\n✅ Dry run complete: {len(tasks)} issues planned")
+        return
+    
     # Step 3: Create issues
     print("=" * 80)
     print("Creating GitHub issues...")
     print("=" * 80 + "\n")
     
-    success_count = 0
-    for task in tasks:
-        body = generate_issue_body(task)
-        if create_issue(task["title"], body, task["labels"]):
-            success_count += 1
+    success_count = create_issues_batch(tasks, repository_id, label_ids)
     
     # Summary
     print("\n" + "=" * 80)